@@ -57,33 +57,11 @@ class Project:
         configuration of the loaded project are updated immediately.
         """
 
-        ukey = key.upper()
-
         if self._builder:
-            self._params[ukey] = value
+            self._params[key.upper()] = value
             return self
 
-        # operating on an existing project ------------------------------
-        cfg_mgr = ConfigManager(self._project.paths)
-        case_file = self._project.root / "case.yaml"
-        case_data: Dict[str, Any] = {}
-        if case_file.exists():
-            case_data = yaml.safe_load(case_file.read_text()) or {}
-
-        global_cfg = cfg_mgr.load_global()
-
-        if ukey in {k.upper() for k in case_data.keys()}:
-            case_data[ukey] = value
-            case_file.write_text(yaml.safe_dump(case_data, sort_keys=False))
-            defaults = generate_global_defaults(case_file, global_default_config())
-            global_cfg.extras.update(defaults)
-        elif ukey not in global_cfg.extras and ukey not in {"PROJECT_UID", "BASE_DIR", "RECIPE"}:
-            raise KeyError(key)
-
-        global_cfg[ukey] = value
-        cfg_mgr.dump_global()
-        self._project.config = global_cfg
-        return self
+        return self.set_bulk({key: value})
 
     def get(self, key: str) -> Any:
         """Return value for ``key`` from case data or the global configuration."""
@@ -128,8 +106,47 @@ class Project:
         raise KeyError(key)
 
     def set_bulk(self, data: Dict[str, Any]) -> "Project":
-        for k, v in data.items():
-            self.set(k, v)
+        """Set several configuration parameters at once.
+
+        On a loaded project ``case.yaml`` and the global configuration are
+        read and written a single time for the whole batch.  Unknown keys
+        raise :class:`KeyError` before anything is written.
+        """
+
+        updates = {k.upper(): (k, v) for k, v in data.items()}
+
+        if self._builder:
+            self._params.update({ukey: v for ukey, (_, v) in updates.items()})
+            return self
+
+        # operating on an existing project ------------------------------
+        cfg_mgr = ConfigManager(self._project.paths)
+        case_file = self._project.root / "case.yaml"
+        case_data: Dict[str, Any] = {}
+        if case_file.exists():
+            case_data = yaml.safe_load(case_file.read_text()) or {}
+
+        global_cfg = cfg_mgr.load_global()
+
+        case_keys = {k.upper() for k in case_data.keys()}
+        case_keys.add("CASE_MULTISHOT")
+        for ukey, (key, _) in updates.items():
+            if ukey in case_keys:
+                continue
+            if ukey not in global_cfg.extras and ukey not in {"PROJECT_UID", "BASE_DIR", "RECIPE"}:
+                raise KeyError(key)
+
+        case_updates = {ukey: v for ukey, (_, v) in updates.items() if ukey in case_keys}
+        if case_updates:
+            case_data.update(case_updates)
+            case_file.write_text(yaml.safe_dump(case_data, sort_keys=False))
+            defaults = generate_global_defaults(case_file, global_default_config())
+            global_cfg.extras.update(defaults)
+
+        for ukey, (_, v) in updates.items():
+            global_cfg[ukey] = v
+        cfg_mgr.dump_global()
+        self._project.config = global_cfg
         return self
 
     def add_job(self, name: str):
@@ -137,6 +154,20 @@ class Project:
             self._jobs.append(name)
             return self
 
+        return self.add_jobs([name])
+
+    def add_jobs(self, names: Iterable[str]):
+        """Add several jobs at once.
+
+        On a loaded project the recipe is built and the job status and
+        global configuration are written a single time for the whole batch.
+        The names of all added jobs, dependencies included, are returned.
+        """
+
+        if self._builder:
+            self._jobs.extend(names)
+            return self
+
         # operating on an existing project ------------------------------
         proj = self._project
         if proj.job_manager is None:
@@ -151,14 +182,16 @@ class Project:
             recipe = RecipeManager.create(proj.config.recipe)
             recipe_jobs = {j.name: j for j in recipe.build(proj)}
 
-        if name.isdigit():
-            idx = int(name) - 1
-            all_jobs = list_jobs()
-            if idx < 0 or idx >= len(all_jobs):
-                raise ValueError("invalid job number")
-            target = all_jobs[idx]
-        else:
-            target = name.upper()
+        targets: list[str] = []
+        for name in names:
+            if name.isdigit():
+                idx = int(name) - 1
+                all_jobs = list_jobs()
+                if idx < 0 or idx >= len(all_jobs):
+                    raise ValueError("invalid job number")
+                targets.append(all_jobs[idx])
+            else:
+                targets.append(name.upper())
 
         added: list[str] = []
 
@@ -180,7 +213,8 @@ class Project:
                 pass
             added.append(jname)
 
-        add_with_deps(target)
+        for target in targets:
+            add_with_deps(target)
 
         proj.job_manager._save_status()
 
@@ -193,11 +227,6 @@ class Project:
 
         return added
 
-    def jobs(self, names: Iterable[str]) -> "Project":
-        for n in names:
-            self.add_job(n)
-        return self
-
     def tag(self, label: str) -> "Project":
         self.tags.append(label)
         return self
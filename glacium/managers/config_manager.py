@@ -35,6 +35,8 @@ from glacium.models.config import GlobalConfig  # type: ignore
 
 __all__ = ["ConfigManager"]
 
+_Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 # ────────────────────────────────────────────────────────────────────────────────
 #  Serializer‑Strategien
@@ -54,7 +56,7 @@ class _YamlSerializer:
     def dump(data: Dict[str, Any], path: Path) -> None:
         """Serialize ``data`` as YAML into ``path``."""
 
-        path.write_text(yaml.dump(data, sort_keys=False), encoding="utf-8")
+        path.write_text(yaml.dump(data, sort_keys=False, Dumper=_Dumper), encoding="utf-8")
 
 
 class _JsonSerializer:
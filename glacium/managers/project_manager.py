@@ -90,7 +90,7 @@ class ProjectManager:
         # Airfoil kopieren
         data_dir = paths.data_dir()
         data_dir.mkdir(exist_ok=True)
-        (data_dir / airfoil.name).write_bytes(airfoil.read_bytes())
+        shutil.copyfile(airfoil, data_dir / airfoil.name)
 
         # Templates rendern (nur falls vorhanden)
         tmpl_root = Path(__file__).resolve().parents[1] / "templates"
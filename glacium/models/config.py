@@ -9,6 +9,9 @@ import yaml
 
 __all__ = ["GlobalConfig"]
 
+# libyaml's emitter when available; output is identical to ``yaml.Dumper``.
+_Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 @dataclass
 class GlobalConfig:
@@ -63,4 +66,4 @@ class GlobalConfig:
                "PROJECT_UID": self.project_uid,
                "BASE_DIR":    str(self.base_dir),
                "RECIPE":      self.recipe}
-        file.write_text(yaml.dump(out, sort_keys=False))
+        file.write_text(yaml.dump(out, sort_keys=False, Dumper=_Dumper))
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Any
 
+import copy
 import math
 import yaml
 
@@ -17,6 +18,22 @@ def _load_yaml(file: Path) -> dict:
     return yaml.safe_load(file.read_text()) if file.exists() else {}
 
 
+_TEMPLATE_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _load_template(file: Path) -> dict:
+    """Return a copy of the parsed ``file``, re-reading it only after it changed."""
+    try:
+        st = file.stat()
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _TEMPLATE_CACHE.get(file)
+    if cached is None or cached[0] != stamp:
+        cached = _TEMPLATE_CACHE[file] = (stamp, _load_yaml(file))
+    return copy.deepcopy(cached[1])
+
+
 def _ambient_pressure(altitude: float) -> float:
     """Return ambient pressure at ``altitude`` in metres (Pa)."""
     return 101325.0 * (1.0 - 2.25577e-5 * altitude) ** 5.2559
@@ -39,7 +56,7 @@ def generate_global_defaults(case_path: Path, template_path: Path) -> Dict[str,
     """
     case_file = case_path / "case.yaml" if case_path.is_dir() else case_path
     case = _load_yaml(case_file)
-    template = _load_yaml(template_path)
+    template = _load_template(template_path)
 
     cfg = dict(template)
 
@@ -1,5 +1,4 @@
 from dataclasses import dataclass, field
-import yaml
 from typing import Any, List
 from .configvar import ConfigVar
 
@@ -11,6 +11,8 @@ base_dir : Path | str, optional
     Directory in which ``01_grid_dependency_study`` will be created.
 case_vars : dict[str, Any] | None, optional
     Case variables overriding the defaults.
+jobs : int, optional
+    Number of grid projects run concurrently in separate processes.
 
 Outputs
 -------
@@ -26,6 +28,7 @@ See Also
 ``docs/full_power_study.rst`` for a complete workflow example.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -33,7 +36,19 @@ from glacium.api import Project
 from glacium.utils.logging import log
 
 
-def main(base_dir: Path | str = Path(""), case_vars: dict[str, Any] | None = None) -> None:
+def _run_project(runs_root: Path, uid: str, factor: float) -> None:
+    proj = Project.load(runs_root, uid)
+    proj.run()
+    log.info(
+        f"Finished refinement {factor} for project {proj.uid} ({proj.root})"
+    )
+
+
+def main(
+    base_dir: Path | str = Path(""),
+    case_vars: dict[str, Any] | None = None,
+    jobs: int = 1,
+) -> None:
     """Create and run grid refinement projects.
 
     Parameters
@@ -42,6 +57,12 @@ def main(base_dir: Path | str = Path(""), case_vars: dict[str, Any] | None = Non
         Directory in which the ``01_grid_dependency_study`` folder will be created.
     case_vars : dict[str, Any] | None, optional
         Case variables overriding the defaults.
+    jobs : int, optional
+        Number of grid projects run concurrently, each in its own process.
+        Several jobs plot with pyplot or change the working directory, so
+        projects must not share a process.  Each solver already uses
+        ``N_CPU`` cores, so lower ``N_CPU`` via ``case_vars`` accordingly
+        when raising ``jobs``.
     """
 
     root = Path(base_dir) / "01_grid_dependency_study"
@@ -76,18 +97,25 @@ def main(base_dir: Path | str = Path(""), case_vars: dict[str, Any] | None = Non
         "FENSAP_CONVERGENCE_STATS",
         "MESH_VISUALIZATION"
     ]
+    for job in base_jobs:
+        base.add_job(job)
 
     refinements = [0.125 * (2 ** i) for i in range(4,7)]
+    projects = []
     for factor in refinements:
-        builder = base.clone()
-        builder.set("PWS_REFINEMENT", factor)
-        for job in base_jobs:
-            builder.add_job(job)
-        proj = builder.create()
-        proj.run()
-        log.info(
-            f"Finished refinement {factor} for project {proj.uid} ({proj.root})"
-        )
+        proj = base.clone().set("PWS_REFINEMENT", factor).create()
+        projects.append((proj.root.parent, proj.uid, factor))
+
+    if jobs <= 1:
+        for item in projects:
+            _run_project(*item)
+        return
+
+    # Projects are created one after another (UIDs are time based); only
+    # the runs overlap, each in a separate process.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for future in [executor.submit(_run_project, *item) for item in projects]:
+            future.result()
 
 
 if __name__ == "__main__":
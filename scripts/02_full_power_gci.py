@@ -24,12 +24,12 @@ python scripts/02_full_power_gci.py
 from __future__ import annotations
 
 from pathlib import Path
-import math
 import subprocess
 import sys
 
 import matplotlib.pyplot as plt
 from matplotlib.ticker import LogLocator, LogFormatterMathtext, NullFormatter
+import numpy as np
 import pandas as pd
 
 # Optional: style presets analog zu 01_timestepstudy.py
@@ -61,7 +61,6 @@ from reportlab.platypus import (
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import cm
 from reportlab.lib import colors
-from math import nan
 
 
 # === Global settings (angelehnt an 01_timestepstudy) ===========================
@@ -106,9 +105,12 @@ def format_log_x_axis(ax):
     ax.tick_params(axis="both", which="both", direction="in", top=True, right=True)
 
 
-def richardson_triad(Q3: float, Q2: float, Q1: float, r: float) -> tuple[float, float, float]:
+def richardson_triad(Q3, Q2, Q1, r) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Richardson-Extrapolation für ein Triad (coarse=Q3, medium=Q2, fine=Q1).
+    Richardson-Extrapolation für Triaden (coarse=Q3, medium=Q2, fine=Q1).
+
+    Alle Argumente dürfen Skalare oder gleich lange Arrays sein; jedes Element
+    ist ein eigenes Triad. Nicht auswertbare Einträge werden NaN.
 
     Parameter
     ---------
@@ -123,35 +125,32 @@ def richardson_triad(Q3: float, Q2: float, Q1: float, r: float) -> tuple[float,
     Q_ext    : extrapolierte Lösung (h→0)
     GCI_fine : GCI (relativ, nicht in %), bezogen auf fine–medium
     """
-    # Verhältnis der Differenzen
-    if (Q2 - Q1) != 0.0:
-        ratio = (Q3 - Q2) / (Q2 - Q1)
-    else:
-        ratio = float("nan")
-
-    if ratio > 0.0 and r > 1.0:
-        p = math.log(abs(ratio)) / math.log(r)
-    else:
-        p = float("nan")
-
+    Q3, Q2, Q1, r = np.broadcast_arrays(*(np.asarray(q, dtype=float) for q in (Q3, Q2, Q1, r)))
+    nans = np.full(Q1.shape, np.nan)
     eps21 = Q1 - Q2
-    if math.isnan(p):
-        return p, float("nan"), float("nan")
 
-    denom = (r**p - 1.0)
-    if denom == 0.0 or math.isnan(denom):
-        return p, float("nan"), float("nan")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Verhältnis der Differenzen
+        ratio = np.divide(Q3 - Q2, -eps21, out=nans.copy(), where=eps21 != 0.0)
+        ok = (ratio > 0.0) & (r > 1.0)
+        p = np.divide(np.log(ratio, out=nans.copy(), where=ok), np.log(r, out=nans.copy(), where=ok),
+                      out=nans.copy(), where=ok)
 
-    Q_ext = Q1 + eps21 / denom
-
-    if Q1 != 0.0:
-        GCI_fine = FS * abs(eps21) / (abs(Q1) * denom)
-    else:
-        GCI_fine = float("nan")
+        denom = r**p - 1.0
+        ok = (denom != 0.0) & ~np.isnan(denom)
+        Q_ext = np.add(Q1, eps21 / denom, out=nans.copy(), where=ok)
+        GCI_fine = np.divide(FS * np.abs(eps21), np.abs(Q1) * denom,
+                             out=nans.copy(), where=ok & (Q1 != 0.0))
 
     return p, Q_ext, GCI_fine
 
 
+def _best_index(e: np.ndarray) -> int | None:
+    """Index des ersten Triplets mit kleinstem endlichem E, sonst ``None``."""
+    e = np.where(np.isnan(e), np.inf, e)
+    return int(np.argmin(e)) if np.isfinite(e).any() else None
+
+
 # === Core ======================================================================
 def compute_h_from_merged(path: Path) -> float:
     """Return mean segment length from a merged Tecplot file."""
@@ -255,60 +254,38 @@ def gci_analysis2(
         log.error("At least three grids are required for GCI analysis.")
         return None
 
-    sliding_results = []  # wird später auch als CSV ausgegeben
-
-    best_idx_cl: int | None = None
-    best_idx_cd: int | None = None
-    best_e_cl = float("inf")
-    best_e_cd = float("inf")
-
-    for i in range(len(runs) - 2):
-        # Triplet G_i (fine), G_{i+1} (medium), G_{i+2} (coarse)
-        f1, phi1_cl, phi1_cd, _ = runs[i]       # fine
-        f2, phi2_cl, phi2_cd, _ = runs[i + 1]   # medium
-        f3, phi3_cl, phi3_cd, _ = runs[i + 2]   # coarse
-
-        r = f2 / f1  # > 1, since f2 is coarser than f1
-
-        # CL
-        p_cl, cl_ext, gci_cl_rel = richardson_triad(
-            Q3=phi3_cl, Q2=phi2_cl, Q1=phi1_cl, r=r
-        )
-        # CD
-        p_cd, cd_ext, gci_cd_rel = richardson_triad(
-            Q3=phi3_cd, Q2=phi2_cd, Q1=phi1_cd, r=r
-        )
-
-        # In Prozent ausdrücken (wie in timestepstudy results.csv)
-        gci_cl = gci_cl_rel * 100.0 if not math.isnan(gci_cl_rel) else nan
-        gci_cd = gci_cd_rel * 100.0 if not math.isnan(gci_cd_rel) else nan
-
-        t = runtimes[i]
-
-        valid_cl = not (math.isnan(p_cl) or p_cl < 0.0 or math.isnan(gci_cl) or gci_cl < 0.0)
-        valid_cd = not (math.isnan(p_cd) or p_cd < 0.0 or math.isnan(gci_cd) or gci_cd < 0.0)
-
-        e_cl = gci_cl * t if (t == t and valid_cl) else float("inf")
-        e_cd = gci_cd * t if (t == t and valid_cd) else float("inf")
-
-        if valid_cl and e_cl < best_e_cl:
-            best_e_cl = e_cl
-            best_idx_cl = i
-
-        if valid_cd and e_cd < best_e_cd:
-            best_e_cd = e_cd
-            best_idx_cd = i
-
-        sliding_results.append(
-            (
-                f1, f2, f3,
-                phi1_cl, phi2_cl, phi3_cl,
-                phi1_cd, phi2_cd, phi3_cd,
-                p_cl, p_cd, cl_ext, cd_ext,
-                gci_cl, gci_cd, t, e_cl, e_cd,
-                valid_cl, valid_cd,
-            )
-        )
+    # Alle Triplets G_i (fine), G_{i+1} (medium), G_{i+2} (coarse) auf einmal
+    f = np.asarray(h_vals, dtype=float)
+    cl = np.asarray(cl_vals, dtype=float)
+    cd = np.asarray(cd_vals, dtype=float)
+    t = np.asarray(runtimes[:-2], dtype=float)
+
+    r = f[1:-1] / f[:-2]  # > 1, since f2 is coarser than f1
+    p_cl, cl_ext, gci_cl = richardson_triad(Q3=cl[2:], Q2=cl[1:-1], Q1=cl[:-2], r=r)
+    p_cd, cd_ext, gci_cd = richardson_triad(Q3=cd[2:], Q2=cd[1:-1], Q1=cd[:-2], r=r)
+
+    # In Prozent ausdrücken (wie in timestepstudy results.csv)
+    gci_cl *= 100.0
+    gci_cd *= 100.0
+
+    # NaN vergleicht immer False, ist also nie gültig
+    valid_cl = (p_cl >= 0.0) & (gci_cl >= 0.0)
+    valid_cd = (p_cd >= 0.0) & (gci_cd >= 0.0)
+
+    e_cl = np.where(valid_cl & (t == t), gci_cl * t, np.inf)
+    e_cd = np.where(valid_cd & (t == t), gci_cd * t, np.inf)
+
+    best_idx_cl = _best_index(e_cl)
+    best_idx_cd = _best_index(e_cd)
+
+    sliding_results = list(zip(  # wird später auch als CSV ausgegeben
+        f[:-2].tolist(), f[1:-1].tolist(), f[2:].tolist(),
+        cl[:-2].tolist(), cl[1:-1].tolist(), cl[2:].tolist(),
+        cd[:-2].tolist(), cd[1:-1].tolist(), cd[2:].tolist(),
+        p_cl.tolist(), p_cd.tolist(), cl_ext.tolist(), cd_ext.tolist(),
+        gci_cl.tolist(), gci_cd.tolist(), t.tolist(), e_cl.tolist(), e_cd.tolist(),
+        valid_cl.tolist(), valid_cd.tolist(),
+    ))
 
     # === CSV-Export im Stil von timestepstudy ==================================
     # 1) Eingaben / Grids
@@ -10,19 +10,27 @@ Changes vs. original:
 
 from __future__ import annotations
 
+import multiprocessing
 from pathlib import Path
 from collections.abc import Sequence
 import matplotlib.pyplot as plt
+from matplotlib.markers import MarkerStyle
 import numpy as np
 import scienceplots
 
-# Use the same scientific style as the original script
-plt.style.use(["science", "ieee"])
-# plt.rcParams.update({"text.usetex": False})
+# Use the same scientific style as the original script. It is applied per
+# plotting call rather than at import so loading this module stays cheap.
+# The science style enables LaTeX; set USETEX = False to plot without it.
+USETEX = True
+STYLE = ["science", "ieee", {"text.usetex": USETEX}]
 
 FIGSIZE_PORTRAIT = (3, 4)   # width, height in inches (hochkant)
 DPI = 300
 
+# Shared line styles for the twin AoA plot, built once and reused per curve
+CL_STYLE = dict(marker=MarkerStyle("^"), markersize=5, linestyle="-", linewidth=0.8)
+CD_STYLE = dict(marker=MarkerStyle("v"), markersize=5, linestyle="--", linewidth=0.8)
+
 
 def load_csv(csv_file: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Return AoA, CL and CD arrays loaded from ``csv_file``."""
@@ -48,6 +56,7 @@ def first_drop_index(vals: Sequence[float]) -> int:
     return len(vals)
 
 
+@plt.style.context(STYLE)
 def plot_combined(
     clean: tuple[np.ndarray, np.ndarray, np.ndarray],
     iced: tuple[np.ndarray, np.ndarray, np.ndarray],
@@ -78,12 +87,12 @@ def plot_combined(
     ax_cd = ax_cl.twinx()
 
     # CL on left axis
-    ln1 = ax_cl.plot(aoa_clean, cl_clean, color="dimgray", marker="^", markersize=5, linestyle="-", linewidth=0.8, label="CL clean")
-    ln3 = ax_cd.plot(aoa_clean, cd_clean, color="darkgrey", marker="v", markersize=5,linewidth=0.8, linestyle="--", label="CD clean")
+    ln1 = ax_cl.plot(aoa_clean, cl_clean, color="dimgray", label="CL clean", **CL_STYLE)
+    ln3 = ax_cd.plot(aoa_clean, cd_clean, color="darkgrey", label="CD clean", **CD_STYLE)
 
     # CD on right axis (use different linestyle to distinguish quantity)
-    ln2 = ax_cl.plot(aoa_iced,  cl_iced, color="maroon", marker="^", markersize=5,linestyle="-", linewidth=0.8, label="CL iced")
-    ln4 = ax_cd.plot(aoa_iced,  cd_iced,  color="firebrick", marker="v", markersize=5,linewidth=0.8, linestyle="--", label="CD iced")
+    ln2 = ax_cl.plot(aoa_iced,  cl_iced, color="maroon", label="CL iced", **CL_STYLE)
+    ln4 = ax_cd.plot(aoa_iced,  cd_iced,  color="firebrick", label="CD iced", **CD_STYLE)
 
     ax_cl.set_xlabel("AoA (deg)")
     ax_cl.set_ylabel("CL")
@@ -99,7 +108,7 @@ def plot_combined(
     ax_cl.legend(lines, labels, loc="best", frameon=True)
 
     fig.tight_layout()
-    fig.savefig(out_dir / "aoa_cl_cd_twin_portrait.png", dpi=600, bbox_inches="tight")
+    fig.savefig(out_dir / "aoa_cl_cd_twin_portrait.png", dpi=DPI)
     plt.close(fig)
 
     # --- CL/CD (efficiency) vs AoA — portrait ---
@@ -120,7 +129,7 @@ def plot_combined(
     ax.legend()
     ax.tick_params(axis="both", direction="in", length=4)
     fig.tight_layout()
-    fig.savefig(out_dir / "aoa_cl_over_cd_portrait.png", dpi=600, bbox_inches="tight")
+    fig.savefig(out_dir / "aoa_cl_over_cd_portrait.png", dpi=DPI)
     plt.close(fig)
 
     # --- CD vs CL polar — portrait (label fix) ---
@@ -133,7 +142,7 @@ def plot_combined(
     ax.legend()
     ax.tick_params(axis="both", direction="in", length=4)
     fig.tight_layout()
-    fig.savefig(out_dir / "cd_cl_polar_portrait.png", dpi=600, bbox_inches="tight")
+    fig.savefig(out_dir / "cd_cl_polar_portrait.png", dpi=DPI)
     plt.close(fig)
 
 
@@ -160,13 +169,14 @@ def main(base_dir: Path | str = Path("")) -> None:
     plot_combined(clean, iced, base / "12_polar_combined_results")
 
 
-if __name__ == "__main__":
-    main()
-
 # ---- BEGIN: Power plots extension ----
 import numpy as _np
 import matplotlib.pyplot as _plt
 
+def _label(tex, plain):
+    """Return ``tex`` if :data:`USETEX` is set, else a plain label that skips mathtext."""
+    return tex if USETEX else plain
+
 def _safe_power_metric(_cl, _cd):
     _cds = _np.where(_cd <= 0, _np.nan, _cd)
     return (_cl ** 3) / (_cds ** 2)
@@ -175,6 +185,18 @@ def _interp_to_grid(x_src, y_src, x_grid):
     o = _np.argsort(x_src)
     return _np.interp(x_grid, x_src[o], y_src[o], left=_np.nan, right=_np.nan)
 
+def _plot_scalar_vs_aoa(ax, curves, ylabel, xlim):
+    """Draw ``curves`` (x, y, marker, label) on ``ax`` with the shared AoA layout."""
+    for x, y, marker, label in curves:
+        ax.plot(x, y, marker=marker, linestyle="-", linewidth=0.8, label=label)
+    ax.set_xlim(*xlim)
+    ax.set_xlabel("AoA (deg)")
+    ax.set_ylabel(ylabel)
+    ax.grid(True, linestyle=":")
+    ax.legend()
+    ax.tick_params(axis="both", direction="in", length=4)
+
+@_plt.style.context(STYLE)
 def add_power_plots(base_dir=Path("")):
     base_dir = Path(base_dir)
     out_dir = base_dir / "12_polar_combined_results"
@@ -214,18 +236,24 @@ def add_power_plots(base_dir=Path("")):
     figsize = (3, 4)
     dpi = 300
 
+    # All power plots share the same single-axis AoA layout: reuse one figure
+    # and pin the x-range once instead of re-autoscaling every plot.
+    xlim = (
+        min(_np.nanmin(aoa_c), _np.nanmin(aoa_i)),
+        max(_np.nanmax(aoa_c), _np.nanmax(aoa_i)),
+    )
+    fig = _plt.figure(figsize=figsize, dpi=dpi)
+
     # --- M vs AoA (clean & iced) ---
-    fig, ax = _plt.subplots(figsize=figsize, dpi=dpi)
-    ax.plot(aoa_c, M_c, marker="^", linestyle="-", linewidth=0.8, label="M clean")
-    ax.plot(aoa_i, M_i, marker="v", linestyle="-", linewidth=0.8, label="M iced")
-    ax.set_xlabel("AoA (deg)")
-    ax.set_ylabel("$M = CL^3 / CD^2$")
-    ax.grid(True, linestyle=":")
-    ax.legend()
-    ax.tick_params(axis="both", direction="in", length=4)
+    ax = fig.add_subplot()
+    _plot_scalar_vs_aoa(
+        ax,
+        [(aoa_c, M_c, "^", "M clean"), (aoa_i, M_i, "v", "M iced")],
+        _label("$M = CL^3 / CD^2$", "M = CL³ / CD²"),
+        xlim,
+    )
     fig.tight_layout()
-    fig.savefig(out_dir / "aoa_M_portrait.png", dpi=600, bbox_inches="tight")
-    _plt.close(fig)
+    fig.savefig(out_dir / "aoa_M_portrait.png", dpi=dpi)
 
     # --- eta = M_iced / M_clean vs AoA (interpolate iced onto clean AoA where overlapping) ---
     lo = max(_np.nanmin(aoa_c), _np.nanmin(aoa_i))
@@ -233,25 +261,38 @@ def add_power_plots(base_dir=Path("")):
     mask_grid = (aoa_c >= lo) & (aoa_c <= hi)
     aoa_grid = aoa_c[mask_grid]
 
-    M_c_grid = _interp_to_grid(aoa_c, M_c, aoa_grid)
+    # The grid is a subset of the clean AoA nodes, so the clean metric needs no
+    # interpolation; only the iced curve is resampled onto it.
+    M_c_grid = M_c[mask_grid]
     M_i_grid = _interp_to_grid(aoa_i, M_i, aoa_grid)
-    eta = M_i_grid / M_c_grid
-
-    fig, ax = _plt.subplots(figsize=figsize, dpi=dpi)
-    ax.plot(aoa_grid, eta, marker=".", linestyle="-", linewidth=0.8, label=r"$\eta = M_{iced} / M_{clean}$")
-    ax.set_xlabel("AoA (deg)")
-    ax.set_ylabel(r"$\eta$")
-    ax.grid(True, linestyle=":")
-    ax.legend()
-    ax.tick_params(axis="both", direction="in", length=4)
+    ok = _np.isfinite(M_c_grid) & _np.isfinite(M_i_grid) & (M_c_grid != 0)
+    with _np.errstate(invalid="ignore", divide="ignore"):
+        eta = _np.where(ok, M_i_grid / M_c_grid, _np.nan)
+
+    fig.clf()
+    ax = fig.add_subplot()
+    _plot_scalar_vs_aoa(
+        ax,
+        [(aoa_grid, eta, ".", _label(r"$\eta = M_{iced} / M_{clean}$", "η = M_iced / M_clean"))],
+        _label(r"$\eta$", "η"),
+        xlim,
+    )
     fig.tight_layout()
-    fig.savefig(out_dir / "aoa_eta_portrait.png", dpi=600, bbox_inches="tight")
+    fig.savefig(out_dir / "aoa_eta_portrait.png", dpi=dpi)
     _plt.close(fig)
 
-# Ensure the extension runs when the script is executed directly
+def _render_task(name):
+    if name == "combined":
+        main()
+    elif name == "power":
+        try:
+            add_power_plots()
+        except Exception as _e:
+            print("[power-plots] skipped:", _e)
+
+# Ensure the extension runs when the script is executed directly; both plot
+# sets only read the sweep CSVs, so they are rendered in separate processes.
 if __name__ == "__main__":
-    try:
-        add_power_plots()
-    except Exception as _e:
-        print("[power-plots] skipped:", _e)
+    with multiprocessing.Pool(processes=2) as _pool:
+        _pool.map(_render_task, ["combined", "power"])
 # ---- END: Power plots extension ----
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
@@ -12,27 +14,42 @@ from typing import Iterable
 def _iter_projects(multishot_root: Path) -> Iterable[Path]:
     """Yield child project directories under ``multishot_root``."""
 
-    if not multishot_root.exists():
+    # A single scandir pass uses the cached directory entry types instead of
+    # stat-ing every child again.
+    try:
+        with os.scandir(multishot_root) as it:
+            entries = [entry for entry in it if entry.is_dir()]
+    except FileNotFoundError:
         return []
 
-    return sorted(
-        project
-        for project in multishot_root.iterdir()
-        if project.is_dir()
-    )
+    entries.sort(key=lambda entry: entry.name)
+    return [Path(entry.path) for entry in entries]
 
 
 def _has_required_inputs(project_dir: Path) -> bool:
     """Check that ``project_dir`` contains the files needed for dataset generation."""
 
-    case_file = project_dir / "case.yaml"
-    analysis_dir = project_dir / "analysis" / "MULTISHOT"
-    return case_file.is_file() and analysis_dir.exists()
+    return os.path.isfile(os.path.join(project_dir, "case.yaml")) and os.path.isdir(
+        os.path.join(project_dir, "analysis", "MULTISHOT")
+    )
+
+
+def _run_dataset_script(dataset_script: Path, cwd: Path) -> None:
+    """Run ``dataset_script`` with the current interpreter inside ``cwd``."""
 
+    subprocess.run(
+        [sys.executable, str(dataset_script)],
+        check=True,
+        cwd=cwd,
+    )
 
 
-def main(base_dir: str | Path | None = None) -> None:
-    """Generate datasets for each multishot project and the aggregate directory."""
+def main(base_dir: str | Path | None = None, jobs: int = 1) -> None:
+    """Generate datasets for each multishot project and the aggregate directory.
+
+    Project datasets are independent, so up to ``jobs`` generator processes
+    may run concurrently (default: one at a time).
+    """
 
     base_path = Path(base_dir) if base_dir is not None else Path(".")
     multishot_root = base_path / "05_multishot"
@@ -47,21 +64,24 @@ def main(base_dir: str | Path | None = None) -> None:
             "Required dataset script 'plot_test.py' is missing in the scripts directory."
         )
 
-    for project_dir in _iter_projects(multishot_root):
-        if not _has_required_inputs(project_dir):
-            continue
-        subprocess.run(
-            [sys.executable, str(dataset_script)],
-            check=True,
-            cwd=project_dir,
-        )
+    project_dirs = [
+        project_dir
+        for project_dir in _iter_projects(multishot_root)
+        if _has_required_inputs(project_dir)
+    ]
+
+    # The work happens in child interpreters, so threads are enough to keep
+    # several of them running at once.
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [
+            executor.submit(_run_dataset_script, dataset_script, project_dir)
+            for project_dir in project_dirs
+        ]
+        for future in as_completed(futures):
+            future.result()
 
     if _has_required_inputs(multishot_root):
-        subprocess.run(
-            [sys.executable, str(dataset_script)],
-            check=True,
-            cwd=multishot_root,
-        )
+        _run_dataset_script(dataset_script, multishot_root)
 
 
 if __name__ == "__main__":
@@ -74,5 +94,12 @@ if __name__ == "__main__":
         default=".",
         help="Base directory containing the 05_multishot folder.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of projects processed concurrently (default: 1).",
+    )
     args = parser.parse_args()
-    main(args.base_dir)
+    main(args.base_dir, jobs=args.jobs)
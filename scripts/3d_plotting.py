@@ -1,9 +1,18 @@
 from __future__ import annotations
-import argparse, re
+import argparse, csv, io, os, re, warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+
+try:
+    from numba import njit
+except ModuleNotFoundError:  # optional: fall back to the plain Python traversal
+    njit = None
 
 # =========================
 # CLI
@@ -18,31 +27,24 @@ def parse_args():
                     help="Output folder")
     ap.add_argument("--select", type=str, default="all",
                     help="Shot indices (0-based) like '0,1,3' or 'all' (default)")
+    ap.add_argument("--cache", action="store_true",
+                    help="Keep parsed shots as merged.dat.npz next to each merged.dat")
     return ap.parse_args()
 
 # =========================
 # YAML (minimal) reader
 # =========================
+_CASE_MULTISHOT_BLOCK = re.compile(
+    r"^[ \t]*CASE_MULTISHOT[ \t]*:[^\n]*\n((?:[ \t]*(?:-[^\n]*)?(?:\n|$))*)", re.M
+)
+_CASE_MULTISHOT_ITEM = re.compile(r"^[ \t]*-[ \t]*([0-9]+(?:\.[0-9]+)?)", re.M)
+
 def read_case_multishot_times(case_yaml: Path) -> List[float]:
     if not case_yaml.exists():
         raise FileNotFoundError(f"{case_yaml} not found")
-    lines = case_yaml.read_text(encoding="utf-8", errors="ignore").splitlines()
-    times: List[float] = []
-    in_block = False
-    for ln in lines:
-        s = ln.strip()
-        if not s:
-            continue
-        if not in_block:
-            if re.match(r"^CASE_MULTISHOT\s*:", s):
-                in_block = True
-            continue
-        m = re.match(r"^-\s*([0-9]+(?:\.[0-9]+)?)", s)
-        if m:
-            times.append(float(m.group(1)))
-        else:
-            if times:
-                break
+    text = case_yaml.read_text(encoding="utf-8", errors="ignore")
+    m = _CASE_MULTISHOT_BLOCK.search(text)
+    times = [float(t) for t in _CASE_MULTISHOT_ITEM.findall(m.group(1))] if m else []
     if not times:
         raise ValueError("CASE_MULTISHOT not found or empty in case.yaml")
     return times
@@ -59,18 +61,20 @@ def clean_label(name: str) -> str:
     return s or name
 
 def rotate_start_argmax_x(*arrays):
-    x = arrays[0]
-    idx = int(np.nanargmax(x))
-    def rot(a): return np.concatenate([a[idx:], a[:idx]])
-    return tuple(rot(a) for a in arrays)
+    idx = int(np.nanargmax(arrays[0]))
+    # roll along the point axis only, so 2D node tables keep their columns
+    return tuple(np.roll(a, -idx, axis=0) for a in arrays)
 
 def enforce_clockwise(*arrays):
     # no-op for 1D chains; keep for compatibility
     return arrays
 
 def arclength(x, y):
-    dx = np.diff(x); dy = np.diff(y)
-    return np.concatenate([[0.0], np.cumsum(np.sqrt(dx*dx + dy*dy))])
+    seg = np.hypot(np.diff(x), np.diff(y))
+    out = np.empty(seg.size + 1, dtype=seg.dtype)
+    out[0] = 0.0
+    np.cumsum(seg, out=out[1:])
+    return out
 
 def scale_s_minus1_to_1(s):
     s0, s1 = float(s[0]), float(s[-1])
@@ -90,10 +94,27 @@ def safe_style():
 # =========================
 # Tecplot reader (with FELINESEG)
 # =========================
+# Node data is kept in single precision: plenty for plotting, half the memory.
+# The text is still parsed as float64 so connectivity indices stay exact.
+NODE_DTYPE = np.float32
+_NUMERIC_START = frozenset("0123456789+-.")
+_RE_N = re.compile(r"\bN\s*=\s*(\d+)", re.I)
+_RE_E = re.compile(r"\bE\s*=\s*(\d+)", re.I)
+_RE_VAR = re.compile(r'"([^"]+)"')
+_RE_NORM = re.compile(r"[^A-Za-z0-9]")
+_RE_FORTRAN_EXP = re.compile(r"(?<=\d)([+\-]\d{2,})")
+_COMMA_TO_SPACE = str.maketrans(",", " ")
+
+def normalized_var_map(var_names: List[str]) -> Dict[str,int]:
+    return { _RE_NORM.sub("",n).lower(): k for k,n in enumerate(var_names) }
+
+def _fix_fortran(s: str) -> str:
+    return _RE_FORTRAN_EXP.sub(r"e\1", s)  # fix 1-03 -> 1e-03
+
 def _read_first_zone_with_conn(path: Path):
     """
     Reads VARIABLES + ZONE N=...,E=..., ZONETYPE=FELINESEG + POINT data.
-    Returns nodes (N, nvars), conn (E,2), var_names, var_map(normalized).
+    Returns nodes (N, nvars) float32, conn (E,2), var_names, var_map(normalized).
     """
     text = path.read_text(encoding="utf-8", errors="replace")
     lines = text.splitlines()
@@ -105,78 +126,115 @@ def _read_first_zone_with_conn(path: Path):
     buf = lines[i_var]; j = i_var+1
     while j < len(lines) and not lines[j].lstrip().upper().startswith("ZONE"):
         buf += " " + lines[j]; j += 1
-    var_names = re.findall(r'"([^"]+)"', buf)
+    var_names = _RE_VAR.findall(buf)
     if not var_names:
         raise ValueError("No variable names parsed")
-    var_map = { re.sub(r"[^A-Za-z0-9]","",n).lower(): k for k,n in enumerate(var_names) }
+    var_map = normalized_var_map(var_names)
 
     # ZONE header
     z0 = next((i for i, ln in enumerate(lines) if ln.lstrip().upper().startswith("ZONE")), None)
     if z0 is None:
         raise ValueError("ZONE header not found")
     header = lines[z0]
-    mN = re.search(r"\bN\s*=\s*(\d+)", header, flags=re.I)
-    mE = re.search(r"\bE\s*=\s*(\d+)", header, flags=re.I)
+    mN = _RE_N.search(header)
+    mE = _RE_E.search(header)
     if not (mN and mE):
         raise ValueError("N= or E= missing in ZONE header")
     N = int(mN.group(1)); E = int(mE.group(1))
 
-    # Node data
-    vals = []
-    k = z0+1
-    float_needed = N * len(var_names)
-    while k < len(lines) and len(vals) < float_needed:
-        s = lines[k].strip(); k += 1
-        if not s: continue
-        if s.upper().startswith("ZONE"): break
-        s = re.sub(r"(?<=\d)([+\-]\d{2,})", r"e\1", s)  # fix 1-03 -> 1e-03
-        for t in s.replace(",", " ").split():
-            try: vals.append(float(t))
-            except: pass
-    nodes = np.array(vals[:float_needed], dtype=float).reshape(N, len(var_names))
-
-    # Connectivity lines (pairs, 1-based)
-    edges = []
-    while k < len(lines) and len(edges) < E:
-        s = lines[k].strip(); k += 1
-        if not s: continue
-        parts = s.replace(",", " ").split()
-        ints = []
-        for p in parts:
-            try: ints.append(int(p))
-            except: pass
-        for a, b in zip(ints[::2], ints[1::2]):
-            edges.append((a-1, b-1))
-    conn = np.array(edges, dtype=int).reshape(-1, 2)
-    return nodes, conn, var_names, var_map
-
-def order_from_connectivity(N: int, conn: np.ndarray) -> np.ndarray:
-    """Build path along the FELINESEG polyline from connectivity graph."""
-    if conn.size == 0:
-        return np.arange(N, dtype=int)
-    deg = np.zeros(N, dtype=int)
-    for a,b in conn:
-        if 0 <= a < N and 0 <= b < N:
-            deg[a] += 1; deg[b] += 1
-    adj = [[] for _ in range(N)]
-    for a,b in conn:
-        if 0 <= a < N and 0 <= b < N:
-            adj[a].append(b); adj[b].append(a)
-    starts = [i for i,d in enumerate(deg) if d == 1]
-    start = starts[0] if starts else 0
-    visited = np.zeros(N, dtype=bool)
-    order = np.empty(N, dtype=int)
+    # Node data + connectivity: the numeric lines after the ZONE header up to
+    # the next ZONE; stray text lines (AUXDATA, DT=...) are left out
+    nvars = len(var_names)
+    float_needed = N * nvars
+    k = z0 + 1
+    while k < len(lines) and lines[k].lstrip()[:1] not in _NUMERIC_START:
+        k += 1  # skip header continuation lines (ZONETYPE=..., DATAPACKING=...)
+    k2 = next((i for i in range(k, len(lines)) if lines[i].lstrip().upper().startswith("ZONE")), len(lines))
+    numeric = [ln.translate(_COMMA_TO_SPACE) for ln in lines[k:k2] if ln.lstrip()[:1] in _NUMERIC_START]
+
+    # Nodes: one per line is parsed in C; wrapped rows take the token walk
+    try:
+        nodes = np.loadtxt(io.StringIO(_fix_fortran("\n".join(numeric[:N]))),
+                           dtype=float, comments=None, ndmin=2)
+        n_used = N if nodes.shape == (N, nvars) else -1
+    except ValueError:
+        n_used = -1
+    if n_used < 0:
+        tokens: List[str] = []
+        for n_used, ln in enumerate(numeric, 1):
+            tokens += _fix_fortran(ln).split()
+            if len(tokens) >= float_needed:
+                break
+        if len(tokens) < float_needed:
+            raise ValueError(f"Expected {float_needed} node values, found {len(tokens)}")
+        nodes = np.array(tokens[:float_needed], dtype=float)
+    nodes = nodes.reshape(N, nvars).astype(NODE_DTYPE)
+
+    # Connectivity lines (pairs, 1-based), paired per line
+    conn_lines = numeric[n_used:]
+    try:
+        conn = np.loadtxt(conn_lines[:E], dtype=int, comments=None, ndmin=2) if E else np.empty((0, 2), int)
+    except ValueError:
+        conn = np.empty((0, 0), dtype=int)
+    if conn.shape[1:] != (2,) or len(conn) != E:
+        edges = []
+        for ln in conn_lines:
+            if len(edges) >= E:
+                break
+            ints = []
+            for p in ln.split():
+                try: ints.append(int(p))
+                except ValueError: pass
+            edges.extend(zip(ints[::2], ints[1::2]))
+        conn = np.array(edges, dtype=int).reshape(-1, 2)
+    return nodes, conn - 1, var_names, var_map
+
+def _csr_adjacency(N: int, conn: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(indptr, indices)`` of the undirected graph, neighbours in edge order."""
+    ok = ((conn >= 0) & (conn < N)).all(axis=1)
+    pairs = conn[ok]
+    src = pairs.ravel()                # a0, b0, a1, b1, ...
+    dst = pairs[:, ::-1].ravel()       # b0, a0, b1, a1, ...
+    indices = dst[np.argsort(src, kind="stable")]
+    indptr = np.zeros(N + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=N), out=indptr[1:])
+    return indptr, indices
+
+def _traverse(indptr, indices, start, order, visited):
+    """Walk the polyline from ``start`` into ``order``; dead ends jump to the lowest unvisited node."""
     order[0] = start; visited[start] = True
     curr = start
-    for i in range(1, N):
-        nxts = [nb for nb in adj[curr] if not visited[nb]]
-        if not nxts:
-            nxt = int(np.argmax(~visited))
-        else:
-            nxt = nxts[0]
+    next_free = 0  # lowest possibly unvisited node; only ever moves forward
+    for i in range(1, len(order)):
+        nxt = -1
+        for j in range(indptr[curr], indptr[curr + 1]):
+            if not visited[indices[j]]:
+                nxt = indices[j]
+                break
+        if nxt < 0:
+            while visited[next_free]:
+                next_free += 1
+            nxt = next_free
         order[i] = nxt
         visited[nxt] = True
         curr = nxt
+
+if njit is not None:
+    _traverse = njit(cache=True, boundscheck=False)(_traverse)
+
+def order_from_connectivity(N: int, conn: np.ndarray) -> np.ndarray:
+    """Build path along the FELINESEG polyline from connectivity graph."""
+    if conn.size == 0:
+        return np.arange(N, dtype=int)
+    indptr, indices = _csr_adjacency(N, conn)
+    starts = np.flatnonzero(np.diff(indptr) == 1)  # polyline end points
+    start = int(starts[0]) if starts.size else 0
+    order = np.empty(N, dtype=np.int64)
+    if njit is not None:
+        _traverse(indptr, indices.astype(np.int64), start, order, np.zeros(N, dtype=np.bool_))
+    else:
+        # plain lists: scalar indexing is much cheaper than on ndarrays
+        _traverse(indptr.tolist(), indices.tolist(), start, order, [False] * N)
     return order
 
 # =========================
@@ -196,34 +254,39 @@ FALLBACK_COLS = {
     "h_ice_a": 32,     # ice thickness (m)
 }
 
+_HEADER_LINE = re.compile(r"^[ \t]*(?:TITLE|VARIABLES|ZONE)\b.*$", re.I | re.M)
+
 def robust_load_nodes_fallback(path: Path) -> np.ndarray:
     """Liest gemischte Datei, filtert Node-Zeilen (viele Spalten), gibt 2D float-Array zurück."""
-    rows = []
-    with open(path, "r", errors="ignore") as f:
-        for line in f:
-            s = line.strip()
-            if not s: continue
-            if s.upper().startswith(("TITLE","VARIABLES","ZONE")):  # sichere Seite
-                continue
-            parts = s.replace(",", " ").split()
-            vals = []
-            ok = True
-            for p in parts:
-                try:
-                    vals.append(float(p) if p.lower()!="nan" else np.nan)
-                except:
-                    ok = False; break
-            if ok and vals:
-                rows.append(vals)
-    if not rows:
+    text = path.read_text(errors="ignore").translate(_COMMA_TO_SPACE)
+    text = _HEADER_LINE.sub("", text)  # sichere Seite
+    lines = [ln for ln in text.splitlines() if ln.strip()]
+    if not lines:
         raise ValueError(f"No numeric rows found in {path}")
-    width = max(len(r) for r in rows)
-    arr = np.full((len(rows), width), np.nan)
-    for i, r in enumerate(rows):
-        arr[i,:len(r)] = r
-    # Node-Zeilen: viele gültige Spalten (Konnekivitätszeilen haben nur 2 Integers)
+    # Breite über die ganze Datei, damit keine Zeile abgeschnitten oder verworfen
+    # wird; kürzere Zeilen (Konnektivität) werden mit NaN aufgefüllt
+    counts = np.fromiter((len(ln.split()) for ln in lines), dtype=np.int64, count=len(lines))
+    df = pd.read_csv(io.StringIO("\n".join(lines)), sep=r"\s+", header=None,
+                     names=range(int(counts.max())), engine="c", quoting=csv.QUOTE_NONE)
+    # Schnellpfad: der C-Parser liefert bereits float-Spalten; nur Spalten mit
+    # nicht-numerischen Tokens nachbehandeln und solche Zeilen ganz verwerfen
+    bad = df.columns[[dt.kind not in "fiu" for dt in df.dtypes]]
+    if len(bad):
+        coerced = df[bad].apply(pd.to_numeric, errors="coerce")
+        rejected = (coerced.isna() & df[bad].notna()).any(axis=1).to_numpy()
+        df[bad] = coerced
+        df = df[~rejected]
+        counts = counts[~rejected]
+    if counts.size == 0:
+        raise ValueError(f"No numeric rows found in {path}")
+    # wie zuvor: so breit wie die längste numerische Zeile
+    arr = df.iloc[:, :int(counts.max())].to_numpy(dtype=NODE_DTYPE)
     finite_counts = np.sum(np.isfinite(arr), axis=1)
-    node_mask = finite_counts >= (0.8 * np.nanmax(finite_counts))  # robust
+    arr = arr[finite_counts > 0]; finite_counts = finite_counts[finite_counts > 0]
+    if arr.size == 0:
+        raise ValueError(f"No numeric rows found in {path}")
+    # Node-Zeilen: viele gültige Spalten (Konnekivitätszeilen haben nur 2 Integers)
+    node_mask = finite_counts >= (0.8 * np.max(finite_counts))  # robust
     return arr[node_mask,:]
 
 # =========================
@@ -245,46 +308,55 @@ VAR_KEYS = {
     "q_evap": "swimsolice000002evaporativeheatflux",
 }
 
+VAR_PREFIXES = {
+    "h_ice_a": "swimsolice000002icethicknessm",
+}
+
 def pick_var(var_map: Dict[str,int], key: str) -> Optional[int]:
     target = VAR_KEYS.get(key)
     if target is None:
         return None
-    for norm, idx in var_map.items():
-        if norm == target:
-            return idx
-    if key == "h_ice_a":
-        for norm, idx in var_map.items():
-            if norm.startswith("swimsolice000002icethicknessm"):
-                return idx
+    idx = var_map.get(target)
+    if idx is not None:
+        return idx
+    # Prefix fallback (unit suffix variants); only scanned when the exact name is absent
+    prefix = VAR_PREFIXES.get(key)
+    if prefix is not None:
+        return next((i for norm, i in var_map.items() if norm.startswith(prefix)), None)
     return None
 
-def try_variable_series_by_index(nodes_o: np.ndarray, key: str) -> Tuple[str, np.ndarray]:
+def try_variable_series_by_index(cols: "NodeColumns", key: str) -> Tuple[str, np.ndarray]:
     idx = FALLBACK_COLS.get(key)
-    if idx is None or idx >= nodes_o.shape[1]:
+    if idx is None or idx >= cols.ncols:
         raise KeyError(f"fallback column for {key} not available")
     label = key
-    data = nodes_o[:, idx].astype(float)
+    data = cols.col(idx)
     return label, data
 
-def variable_series(nodes_o: np.ndarray, var_names: List[str] | None,
+def variable_series(cols: "NodeColumns", var_names: List[str] | None,
                     var_map: Dict[str,int] | None, key: str) -> Tuple[str, np.ndarray]:
     if var_map:
         idx = pick_var(var_map, key)
         if idx is not None:
             label = clean_label(var_names[idx]) if var_names else key
-            return label, nodes_o[:, idx].astype(float)
+            return label, cols.col(idx)
     # Fallback by column index
-    return try_variable_series_by_index(nodes_o, key)
+    return try_variable_series_by_index(cols, key)
+
+def has_variable(cols: "NodeColumns", var_map: Dict[str,int] | None, key: str) -> bool:
+    """True if :func:`variable_series` can resolve ``key`` (by name or fallback column)."""
+    if var_map and pick_var(var_map, key) is not None:
+        return True
+    idx = FALLBACK_COLS.get(key)
+    return idx is not None and idx < cols.ncols
 
 # =========================
 # Per-shot loading & ordering
 # =========================
-def load_shot(root: Path, shot_idx: int) -> Tuple[np.ndarray, np.ndarray, List[str] | None, Dict[str,int] | None]:
-    path = root / f"{six_digit(shot_idx)}" / "merged.dat"
-    if not path.exists():
-        raise FileNotFoundError(f"Missing: {path}")
-    text_head = path.read_text(errors="ignore")[:256].upper()
-    if "VARIABLES" in text_head and "ZONE" in text_head:
+def _parse_shot(path: Path) -> Tuple[np.ndarray, np.ndarray, List[str] | None, Dict[str,int] | None]:
+    with path.open("rb") as f:  # sniff the header only, not the whole file
+        head = f.read(512).upper()
+    if b"VARIABLES" in head and b"ZONE" in head:
         nodes, conn, var_names, var_map = _read_first_zone_with_conn(path)
     else:
         nodes = robust_load_nodes_fallback(path)
@@ -293,7 +365,61 @@ def load_shot(root: Path, shot_idx: int) -> Tuple[np.ndarray, np.ndarray, List[s
         var_map = None
     return nodes, conn, var_names, var_map
 
-def prep_xy_s(nodes: np.ndarray, conn: np.ndarray, var_map: Dict[str,int] | None) -> Tuple[np.ndarray,np.ndarray,np.ndarray,np.ndarray,np.ndarray]:
+@lru_cache(maxsize=None)
+def _load_shot_cached(path: Path, mtime_ns: int, size: int, cache: bool = False):
+    """Parse ``path`` once per (mtime, size).
+
+    With ``cache`` the arrays are also kept next to it as ``<name>.npz``,
+    together with the (mtime, size) of the source they were parsed from.
+    """
+    npz = path.with_name(path.name + ".npz")
+    if cache and npz.exists():
+        try:
+            with np.load(npz) as d:
+                if "source" in d.files and tuple(d["source"]) == (mtime_ns, size):
+                    nodes, conn = d["nodes"].astype(NODE_DTYPE, copy=False), d["conn"]
+                    var_names = [str(n) for n in d["var_names"]] or None
+                    return nodes, conn, var_names, normalized_var_map(var_names) if var_names else None
+        except (OSError, ValueError, KeyError) as e:
+            warnings.warn(f"ignoring unreadable cache {npz}: {e}")
+    nodes, conn, var_names, var_map = _parse_shot(path)
+    if cache:
+        try:
+            np.savez(npz, nodes=nodes, conn=conn, var_names=np.array(var_names or [], dtype=str),
+                     source=np.array([mtime_ns, size], dtype=np.int64))
+        except OSError as e:
+            warnings.warn(f"could not write cache {npz}: {e}")
+    return nodes, conn, var_names, var_map
+
+def load_shot(root: Path, shot_idx: int, cache: bool = False) -> Tuple[np.ndarray, np.ndarray, List[str] | None, Dict[str,int] | None]:
+    path = root / f"{six_digit(shot_idx)}" / "merged.dat"
+    if not path.exists():
+        raise FileNotFoundError(f"Missing: {path}")
+    st = path.stat()
+    return _load_shot_cached(path, st.st_mtime_ns, st.st_size, cache)
+
+class NodeColumns:
+    """Wall-ordered view of the raw node table that gathers columns on demand.
+
+    Only the few columns a plot actually reads are reordered (and cached),
+    instead of permuting the whole ``(N, nvars)`` table up front.
+    """
+
+    def __init__(self, nodes_raw: np.ndarray, order: np.ndarray):
+        self._raw = nodes_raw
+        self._order = order
+        self._cache: Dict[int, np.ndarray] = {}
+
+    @property
+    def ncols(self) -> int:
+        return self._raw.shape[1]
+
+    def col(self, i: int) -> np.ndarray:
+        if i not in self._cache:
+            self._cache[i] = self._raw[self._order, i].astype(NODE_DTYPE, copy=False)
+        return self._cache[i]
+
+def prep_xy_s(nodes: np.ndarray, conn: np.ndarray, var_map: Dict[str,int] | None) -> Tuple[NodeColumns,np.ndarray,np.ndarray,np.ndarray,np.ndarray]:
     # Geometry indices
     if var_map:
         xi = var_map.get("x")
@@ -301,19 +427,18 @@ def prep_xy_s(nodes: np.ndarray, conn: np.ndarray, var_map: Dict[str,int] | None
     else:
         xi = FALLBACK_COLS.get("x")
         yi = FALLBACK_COLS.get("y")
-    x = nodes[:, xi].astype(float)
-    y = nodes[:, yi].astype(float) if yi is not None else np.zeros_like(x)
 
-    # Order along wall
+    # Order along wall; the start rotation is folded into the order itself
     N = nodes.shape[0]
     order = order_from_connectivity(N, conn)
-    nodes_o = nodes[order, :]
-    x_o = x[order]; y_o = y[order]
-    arrays = (x_o, y_o, nodes_o)
+    x_o = nodes[order, xi].astype(NODE_DTYPE, copy=False)
+    y_o = nodes[order, yi].astype(NODE_DTYPE, copy=False) if yi is not None else np.zeros_like(x_o)
+    arrays = (x_o, y_o, order)
     arrays = rotate_start_argmax_x(*arrays)
     arrays = enforce_clockwise(*arrays)
     arrays = rotate_start_argmax_x(*arrays)
-    x_o, y_o, nodes_o = arrays
+    x_o, y_o, order = arrays
+    nodes_o = NodeColumns(nodes, order)
 
     # Normalize by chord
     c = float(np.nanmax(x_o))
@@ -332,42 +457,63 @@ def ensure_outdir(base: Path) -> Path:
     base.mkdir(parents=True, exist_ok=True)
     return base
 
-def overlay_var_over_xc(ax, root: Path, sel: List[int], cum_times: List[float],
+def shot_series(nodes_o: NodeColumns, var_names: List[str] | None,
+                var_map: Dict[str,int] | None, key: str) -> np.ndarray:
+    """Return the ordered series for ``key``; ``tau_abs`` is the wall-shear magnitude."""
+    if key == "tau_abs":
+        _, t1 = variable_series(nodes_o, var_names, var_map, "tau1")
+        _, t2 = variable_series(nodes_o, var_names, var_map, "tau2")
+        # |tau| = hypot(hypot(t1, t2), t3): one fresh buffer, updated in place
+        # (t1/t2 are cached columns and must not be modified)
+        out = np.hypot(t1, t2)
+        if has_variable(nodes_o, var_map, "tau3"):  # tau3 optional
+            _, t3 = variable_series(nodes_o, var_names, var_map, "tau3")
+            np.hypot(out, t3, out=out)
+        return out
+    _, arr = variable_series(nodes_o, var_names, var_map, key)
+    return arr
+
+def prep_shot(root: Path, k0: int, cache: bool = False):
+    """Load and order shot ``k0`` (0-based): ``(nodes_o, x_over_c, var_names, var_map)``."""
+    nodes, conn, var_names, var_map = load_shot(root, k0 + 1, cache)
+    nodes_o, x_over_c, y_over_c, s_unit, order = prep_xy_s(nodes, conn, var_map)
+    return nodes_o, x_over_c, var_names, var_map
+
+def prepare_shots(root: Path, shots: List[int], cache: bool = False) -> Dict[int, tuple]:
+    """Run :func:`prep_shot` for ``shots`` in worker processes, keyed by shot.
+
+    Shots that fail to load are reported and left out; order follows ``shots``.
+    """
+    prepared = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        futures = [(k0, ex.submit(prep_shot, root, k0, cache)) for k0 in shots]
+        for k0, fut in futures:
+            try:
+                prepared[k0] = fut.result()
+            except Exception as e:
+                print(f"[warn] shot {k0 + 1:06d}: {e}")
+    return prepared
+
+def overlay_var_over_xc(ax, prepared: Dict[int, tuple], cum_times: List[float],
                         key: str, ylabel: str, title: Optional[str]=None):
-    for k0 in sel:
-        k = k0 + 1  # convert 0-based to shot folder index
+    for k0, (nodes_o, x_over_c, var_names, var_map) in prepared.items():
         try:
-            nodes, conn, var_names, var_map = load_shot(root, k)
-            nodes_o, x_over_c, y_over_c, s_unit, order = prep_xy_s(nodes, conn, var_map)
-            if key == "tau_abs":
-                _, t1 = variable_series(nodes_o, var_names, var_map, "tau1")
-                _, t2 = variable_series(nodes_o, var_names, var_map, "tau2")
-                # tau3 optional
-                try:
-                    _, t3 = variable_series(nodes_o, var_names, var_map, "tau3")
-                except KeyError:
-                    t3 = np.zeros_like(t1)
-                arr = np.sqrt(t1**2 + t2**2 + t3**2)
-            else:
-                _, arr = variable_series(nodes_o, var_names, var_map, key)
-            lbl = f"t={cum_times[k0]:.0f} s"
-            ax.plot(x_over_c, arr, lw=1.0, label=lbl)
+            arr = shot_series(nodes_o, var_names, var_map, key)
         except Exception as e:
-            print(f"[warn] shot {k:06d}: {e}")
+            print(f"[warn] shot {k0 + 1:06d}: {e}")
             continue
+        lbl = f"t={cum_times[k0]:.0f} s"
+        ax.plot(x_over_c, arr, lw=1.0, label=lbl)
     ax.set_xlabel("x/c"); ax.set_ylabel(ylabel)
     if title:
         ax.set_title(title)
     ax.legend(title="Shot end time", fontsize=8, ncols=2, handlelength=1.8)
-def plot_ice_spacetime(root: Path, times: list[float], outdir: Path):
-    """3D surface or contour plot h_ice(x/c, t)."""
+def plot_ice_spacetime(prepared: Dict[int, tuple], times: list[float], outdir: Path):
+    """3D surface or contour plot h_ice(x/c, t) from the shots in ``prepared``."""
     shots = []
-    for i in range(len(times)):
+    for i, (nodes_o, x_over_c, var_names, var_map) in prepared.items():
         try:
-            nodes, conn, var_names, var_map = load_shot(root, i+1)
-            nodes_o, x_over_c, y_over_c, s_unit, order = prep_xy_s(nodes, conn, var_map)
-            _, h = variable_series(nodes_o, var_names, var_map, "h_ice_a")
-            shots.append((x_over_c, h))
+            shots.append((x_over_c, shot_series(nodes_o, var_names, var_map, "h_ice_a")))
         except Exception as e:
             print(f"[warn] {i+1:06d}: {e}")
             continue
@@ -377,6 +523,8 @@ def plot_ice_spacetime(root: Path, times: list[float], outdir: Path):
     t_common = np.cumsum(times)
     H = np.zeros((len(t_common), len(x_common)))
 
+    # One C-level np.interp per shot: shots differ in length, and stacking them
+    # for a single searchsorted pass costs more (sort + gathers) than it saves.
     for j, (x, h) in enumerate(shots):
         H[j, :] = np.interp(x_common, x, h, left=np.nan, right=np.nan)
 
@@ -385,7 +533,10 @@ def plot_ice_spacetime(root: Path, times: list[float], outdir: Path):
     fig = plt.figure(figsize=(7, 4.5))
     ax = fig.add_subplot(111, projection='3d')
     X, T = np.meshgrid(x_common, t_common)
-    ax.plot_surface(X, T, H, cmap="viridis", rstride=1, cstride=1, linewidth=0)
+    # ~60x60 facets at most: the 3D renderer draws each polygon in Python
+    ax.plot_surface(X, T, H, cmap="viridis",
+                    rstride=max(1, len(t_common) // 60), cstride=max(1, len(x_common) // 60),
+                    linewidth=0, antialiased=False, shade=False)
     ax.set_xlabel("x/c")
     ax.set_ylabel("Time (s)")
     ax.set_zlabel("Ice thickness (m)")
@@ -432,24 +583,30 @@ def main():
             sel = list(range(nshots))  # fallback to all
 
     root = args.root
-
-    # 1) h_ice overlays (all selected)
-    fig, ax = plt.subplots(figsize=(6.3, 4.0))
-    overlay_var_over_xc(ax, root, sel, cum_times, "h_ice_a", "Ice thickness h_ice (m)", "Ice accretion over shots")
-    fig.tight_layout(); fig.savefig(outdir / "h_ice_vs_xc_overlay_full.pdf"); plt.close(fig)
-
-    # 2) Drivers (all selected as Wunsch)
-    for key, ylabel, fname in [
-        ("tau_abs", r"|tau_w| (Pa)", "tauw_vs_xc_overlay_full.pdf"),
-        ("q_classic", "Heat flux (W/m^2)", "qflux_vs_xc_overlay_full.pdf"),
-        ("beta", "Collection efficiency (-)", "beta_vs_xc_overlay_full.pdf"),
-        ("freezing_frac", "Freezing fraction (-)", "freezing_vs_xc_overlay_full.pdf"),
-    ]:
+    # Load + order every shot once; the overlays (selection) and the
+    # space-time plot (all shots) share the same prepared data
+    all_shots = prepare_shots(root, list(range(nshots)), args.cache)
+    prepared = {k0: all_shots[k0] for k0 in sel if k0 in all_shots}
+
+    # All overlays go into one multi-page PDF so fonts are embedded only once
+    with PdfPages(outdir / "overlays.pdf") as pdf:
+        # 1) h_ice overlays (all selected)
         fig, ax = plt.subplots(figsize=(6.3, 4.0))
-        overlay_var_over_xc(ax, root, sel, cum_times, key, ylabel)
-        fig.tight_layout(); fig.savefig(outdir / fname); plt.close(fig)
+        overlay_var_over_xc(ax, prepared, cum_times, "h_ice_a", "Ice thickness h_ice (m)", "Ice accretion over shots")
+        fig.tight_layout(); pdf.savefig(fig); plt.close(fig)
+
+        # 2) Drivers (all selected as Wunsch)
+        for key, ylabel in [
+            ("tau_abs", r"|tau_w| (Pa)"),
+            ("q_classic", "Heat flux (W/m^2)"),
+            ("beta", "Collection efficiency (-)"),
+            ("freezing_frac", "Freezing fraction (-)"),
+        ]:
+            fig, ax = plt.subplots(figsize=(6.3, 4.0))
+            overlay_var_over_xc(ax, prepared, cum_times, key, ylabel)
+            fig.tight_layout(); pdf.savefig(fig); plt.close(fig)
     # Nach den Overlays:
-    plot_ice_spacetime(root, times, outdir)
+    plot_ice_spacetime(all_shots, times, outdir)
 
     print("Wrote overlays to:", outdir.resolve())
 
@@ -69,9 +69,12 @@ def potential_drag_power(cl: float, cd: float, v_w: float, area: float, rho: flo
 
 def plot_simple_kite(L_values: list[float], outdir: Path):
     v = np.linspace(0.0, 1.0, 600)
+    # (K, 1) gegen (600,) → alle Kurven in einer Auswertung
+    F = F_simple(np.asarray(L_values, dtype=float)[:, None], v)
     plt.figure()
-    for L in L_values:
-        plt.plot(v, F_simple(L, v), label=f"L/D={L}")
+    lines = plt.plot(v, F.T)
+    for line, L in zip(lines, L_values):
+        line.set_label(f"L/D={L}")
     plt.xlabel(r"$V_L / V_w$")
     plt.ylabel(r"$F_s$")
     plt.title("Simple‑Kite‑Power (Loyd 1980, Fig. 2)")
@@ -106,12 +109,13 @@ def plot_cross_drag(L_value: float, outdir: Path):
 def plot_potential_power(cl: float, cd: float, speeds: list[float], area: float, rho: float, outdir: Path):
     L_over_D = cl / cd
     Ls = np.linspace(1.0, L_over_D * 2, 300)  # x‑Achse erweitert über aktuelles L/D hinaus
+    Fd_max = 4 / 27 * Ls ** 2
+    # Zeilen: Windgeschwindigkeiten, Spalten: L/D
+    power = (0.5 * rho * area * cl / 1e6) * np.multiply.outer(np.asarray(speeds, dtype=float) ** 3, Fd_max)  # → MW
     plt.figure()
-    for v in speeds:
-        Pw = 0.5 * rho * v ** 3
-        Fd_max = 4 / 27 * Ls ** 2
-        power = Pw * area * cl * Fd_max / 1e6  # → MW
-        plt.plot(Ls, power, label=f"V_w={v} m/s")
+    lines = plt.plot(Ls, power.T)
+    for line, v in zip(lines, speeds):
+        line.set_label(f"V_w={v} m/s")
     plt.xlabel("L/D")
     plt.ylabel("P_ideal [MW]")
     plt.title("Potentielle Drag‑Power (Loyd 1980, Fig. 5)")
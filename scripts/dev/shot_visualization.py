@@ -3,7 +3,6 @@ import matplotlib.patches as mpatches
 import numpy as np
 import matplotlib as mpl
 from matplotlib.ticker import MultipleLocator, FuncFormatter
-from matplotlib.cm import get_cmap
 import scienceplots
 
 # --- Stil & Font ---
@@ -48,12 +47,15 @@ colors = {
     "Main_S490": "#a6d8ff",
     "Main_SC10+S480": "#7ec3ff",
 }
-colormap = get_cmap("Blues")
+colormap = mpl.colormaps["Blues"]
 ms_levels = {
     "SC10+MS2x240": 0.55,
     "SC10+MS4x120": 0.7,
     "SC10+MS8x60":  0.85,
 }
+# Farben einmal auflösen statt pro Balken die Colormap zu interpolieren
+ms_rgba = {label: colormap(level) for label, level in ms_levels.items()}
+main_default = colormap(0.6)
 
 # --- Plot-Größe ---
 cm = 1 / 2.54
@@ -69,9 +71,9 @@ for idx, (label, segments) in enumerate(cases.items()):
         if seg_label == "SC":
             color = colors["SC"]
         elif label in ["S490", "SC10+S480"]:
-            color = colors.get(f"Main_{label}", colormap(0.6))
+            color = colors.get(f"Main_{label}", main_default)
         else:
-            color = colormap(ms_levels[label])
+            color = ms_rgba[label]
         ax.barh(idx, duration, left=start, height=0.5,
                 color=color, edgecolor="black")
 
@@ -97,16 +99,22 @@ legend_patches = [
     mpatches.Patch(facecolor=colors["SC"], edgecolor="black", label="SC (10 s)"),
     mpatches.Patch(facecolor=colors["Main_S490"], edgecolor="black", label="S490"),
     mpatches.Patch(facecolor=colors["Main_SC10+S480"], edgecolor="black", label="SC10+S480"),
-    mpatches.Patch(facecolor=colormap(ms_levels["SC10+MS2x240"]), edgecolor="black", label="SC10+MS2x240"),
-    mpatches.Patch(facecolor=colormap(ms_levels["SC10+MS4x120"]), edgecolor="black", label="SC10+MS4x120"),
-    mpatches.Patch(facecolor=colormap(ms_levels["SC10+MS8x60"]),  edgecolor="black", label="SC10+MS8x60"),
+    mpatches.Patch(facecolor=ms_rgba["SC10+MS2x240"], edgecolor="black", label="SC10+MS2x240"),
+    mpatches.Patch(facecolor=ms_rgba["SC10+MS4x120"], edgecolor="black", label="SC10+MS4x120"),
+    mpatches.Patch(facecolor=ms_rgba["SC10+MS8x60"],  edgecolor="black", label="SC10+MS8x60"),
 ]
 # fig.legend(handles=legend_patches, loc="lower center", ncol=3, frameon=True, bbox_to_anchor=(0.5, 0.02))
 
 # --- Speichern ---
+# Das PDF (Vektor) ist die maßgebliche Ausgabe; das PNG ist nur eine Vorschau.
+# Für ~30 Rechtecke reichen 200 dpi, 600 dpi kosten das 9-fache an Pixeln.
+# Layout und Tight-Box einmal bestimmen und für beide Formate verwenden,
+# statt dass jeder savefig(bbox_inches='tight') einen eigenen Probelauf zeichnet.
 from datetime import date
 basename = f"fig_time_dependency_study_{date.today().isoformat()}"
-plt.savefig(f"{basename}.pdf", format="pdf", bbox_inches='tight')
-plt.savefig(f"{basename}.png", format="png", dpi=600, bbox_inches='tight', transparent=True)
+fig.canvas.draw()
+bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(mpl.rcParams["savefig.pad_inches"])
+fig.savefig(f"{basename}.pdf", format="pdf", bbox_inches=bbox)
+fig.savefig(f"{basename}.png", format="png", dpi=200, bbox_inches=bbox, transparent=True)
 
 plt.show()
@@ -1,4 +1,4 @@
-import re, numpy as np, pandas as pd, matplotlib.pyplot as plt
+import mmap, re, warnings, numpy as np, matplotlib.pyplot as plt
 from scipy.spatial import cKDTree
 from matplotlib.backends.backend_pdf import PdfPages
 import scienceplots
@@ -11,6 +11,9 @@ CSV_Z0  = "000020.csv"
 PDF_Z0  = "000020.pdf"
 
 # ─────────── helper functions ───────────
+_STL_VERTEX = re.compile(rb'^\s*vertex\s+(\S+)\s+(\S+)\s+(\S+)', re.MULTILINE)
+_RE_FORTRAN_EXP = re.compile(r'(?<=\d)([+\-]\d{2,})')
+
 def _fix_fortran(tok: str) -> float:
     """
     Convert numbers missing the 'E' in Fortran sci-notation → float.
@@ -21,6 +24,10 @@ def _fix_fortran(tok: str) -> float:
     m = re.match(r'([+-]?[0-9.]+)([+-][0-9]{2,4})', tok)
     return float(f"{m.group(1)}E{m.group(2)}") if m else float(tok)
 
+def _fix_fortran_block(text: str) -> str:
+    """Insert the missing 'E' for every Fortran exponent in a block of numbers."""
+    return _RE_FORTRAN_EXP.sub(r'E\1', text)  # fix 1-03 -> 1E-03
+
 def read_zone_by_title(dat_path: str, target_title: str = "WALL_2001"):
     """
     Return (variable names, numpy array) for the Tecplot ZONE whose
@@ -40,35 +47,48 @@ def read_zone_by_title(dat_path: str, target_title: str = "WALL_2001"):
             raise ValueError(f'ZONE with T="{target_title}" not found in {dat_path}')
 
         # read the node block for the located zone
-        rows = []
-        for _ in range(N):
-            tokens = f.readline().strip().split()
-            rows.append([_fix_fortran(tok) for tok in tokens])
-
+        lines = [f.readline() for _ in range(N)]
+
+    # fast path: patch all exponents at once and let NumPy parse the block
+    ncols = len(lines[0].split()) if lines else 0
+    block = _fix_fortran_block("".join(lines))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        vals = np.fromstring(block, dtype=float, sep=" ")
+    if vals.size == N * ncols:
+        return var_names, vals.reshape(N, ncols)
+
+    # fallback: token by token
+    rows = [[_fix_fortran(tok) for tok in line.split()] for line in lines]
     return var_names, np.asarray(rows)
 
 
 def build_nn_path_s(stl_path: str):
     """Return STL vertices ordered by a nearest-neighbour path and cumulative arc length s."""
-    verts = []
-    with open(stl_path, 'r') as f:
-        for line in f:
-            if line.strip().startswith("vertex"):
-                _, x, y, z = line.split()
-                verts.append((float(x), float(y), float(z)))
-    pts = np.unique(np.round(np.array(verts), 6), axis=0)
+    with open(stl_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        verts = np.fromregex(mm, _STL_VERTEX, dtype=[('x', 'f8'), ('y', 'f8'), ('z', 'f8')])
+    verts = verts.view('f8').reshape(-1, 3)
+    pts = np.unique(np.round(verts, 6), axis=0)
 
     N = len(pts)
+    tree = cKDTree(pts)
     visited = np.zeros(N, bool)
     order = []
     idx = np.argmax(pts[:, 0])             # start at max X
-    for _ in range(N):
+    for step in range(N):
         order.append(idx)
         visited[idx] = True
-        if visited.all(): break
-        remaining = np.where(~visited)[0]
-        dists = np.linalg.norm(pts[remaining] - pts[idx], axis=1)
-        idx = remaining[np.argmin(dists)]
+        if step == N - 1: break
+        # nearest unvisited vertex: widen the query until one shows up
+        k = min(32, N)
+        while True:
+            _, cand = tree.query(pts[idx], k=k)
+            cand = np.atleast_1d(cand)
+            cand = cand[~visited[cand]]
+            if cand.size:
+                idx = cand[0]
+                break
+            k = min(2 * k, N)
 
     path   = pts[order]
     seglen = np.linalg.norm(np.diff(path, axis=0), axis=1)
@@ -80,31 +100,29 @@ def build_nn_path_s(stl_path: str):
 var_names, data_all = read_zone_by_title(DAT_FILE, target_title="WALL_2001")
 path_pts, s_path    = build_nn_path_s(STL_FILE)
 
-tree           = cKDTree(path_pts)
-_, idx_nearest = tree.query(data_all[:, :3], k=1)
-s_all          = s_path[idx_nearest]
-
 mask_z0   = np.abs(data_all[:, 2]) < 1e-8
 data      = data_all[mask_z0]
-s_dat     = s_all[mask_z0]
 
-df = pd.DataFrame(data, columns=var_names)
-df.insert(0, "s [m]", s_dat)
-df.to_csv(CSV_Z0, index=False)
+tree           = cKDTree(path_pts)
+_, idx_nearest = tree.query(data[:, :3], k=1, workers=-1)
+s_dat          = s_path[idx_nearest]
+
+np.savetxt(CSV_Z0, np.column_stack([s_dat, data]), fmt="%.17g", delimiter=",",
+           header=",".join(["s [m]", *var_names]), comments="")
 
 order = np.argsort(s_dat)
+fig, ax = plt.subplots(figsize=(8, 5))     # one figure, cleared per variable
 with PdfPages(PDF_Z0) as pdf:
-    for name in var_names:
-        y = df[name].values
-        plt.figure(figsize=(8, 5))
-        plt.plot(s_dat[order], y[order])
-        plt.xlabel("s [m]")
-        plt.ylabel(name)
-        plt.xlim(0.1, 0.3)
-        plt.title(f"{name} vs s (Z ≈ 0)")
-        plt.tight_layout()
-        pdf.savefig()
-        plt.close()
+    for j, name in enumerate(var_names):
+        ax.clear()
+        ax.plot(s_dat[order], data[order, j])
+        ax.set_xlabel("s [m]")
+        ax.set_ylabel(name)
+        ax.set_xlim(0.1, 0.3)
+        ax.set_title(f"{name} vs s (Z ≈ 0)")
+        fig.tight_layout()
+        pdf.savefig(fig)
+plt.close(fig)
 
 print(f"Filtered CSV saved: {CSV_Z0}")
 print(f"Filtered plots PDF saved: {PDF_Z0}")
@@ -1,11 +1,16 @@
 import glob, os, re
-import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 import scienceplots
 plt.style.use(['science', 'no-latex'])
 
+try:
+    import pyarrow  # noqa: F401  – optional: multithreaded CSV-Parser
+    CSV_ENGINE = "pyarrow"
+except ModuleNotFoundError:
+    CSV_ENGINE = "c"
+
 # ────────────── anpassen falls nötig ──────────────
 CSV_PATTERN   = "0000*.csv"   # oder z.B. "*.csv"
 OUTPUT_PDF    = "summary.pdf"
@@ -16,29 +21,31 @@ csv_files = sorted(glob.glob(CSV_PATTERN))
 if not csv_files:
     raise RuntimeError(f"Keine Dateien passend zu '{CSV_PATTERN}' gefunden.")
 
-dfs        = [pd.read_csv(f) for f in csv_files]
+dfs        = [pd.read_csv(f, engine=CSV_ENGINE) for f in csv_files]
+# Sortieren nach s – einmal pro Datei statt pro Variable
+for df in dfs:
+    df.sort_values("s [m]", inplace=True, kind="mergesort", ignore_index=True)
 var_names  = dfs[0].columns[1:]     # erste Spalte ist "s [m]"
 
 # ────────────── Plotten ──────────────
+fig, ax = plt.subplots(figsize=(8, 5))   # eine Figure, pro Variable geleert
 with PdfPages(OUTPUT_PDF) as pdf:
     for var in var_names:
-        plt.figure(figsize=(8, 5))
+        ax.clear()
         for f, df in zip(csv_files, dfs):
             label = os.path.splitext(os.path.basename(f))[0]
-            # Sortieren nach s – falls die Daten nicht bereits sortiert sind
-            order = np.argsort(df["s [m]"].values)
-            plt.plot(df["s [m]"].values[order],
-                     df[var].values[order],
-                     label=label,
-                     linewidth=1.0)
+            ax.plot(df["s [m]"].values,
+                    df[var].values,
+                    label=label,
+                    linewidth=1.0)
 
-        plt.xlabel("s [m]")
-        plt.ylabel(var)
-        plt.xlim(*XLIM)
-        plt.title(f"{var} vs s – alle Dateien")
-        plt.legend(fontsize="x-small", ncol=2, frameon=False)
-        plt.tight_layout()
-        pdf.savefig()
-        plt.close()
+        ax.set_xlabel("s [m]")
+        ax.set_ylabel(var)
+        ax.set_xlim(*XLIM)
+        ax.set_title(f"{var} vs s – alle Dateien")
+        ax.legend(fontsize="x-small", ncol=2, frameon=False)
+        fig.tight_layout()
+        pdf.savefig(fig)
+plt.close(fig)
 
 print(f"Gesammelte Kurven-PDF gespeichert: {OUTPUT_PDF}")
@@ -12,40 +12,45 @@ def main():
         .name("X Grid")
         .create()
     )
-    # Case definition
-    prj.set("CASE_ROUGHNESS", 0.0004)
-    prj.set("CASE_CHARACTERISTIC_LENGTH", 0.431)
-    prj.set("CASE_VELOCITY", 50)
-    prj.set("CASE_ALTITUDE", 0)
-    prj.set("CASE_TEMPERATURE", 263.15)
-    prj.set("CASE_AOA", 0)
-    prj.set("CASE_MVD", 20)
-    prj.set("CASE_LWC", 0.0052)
-    prj.set("CASE_YPLUS", 0.3)
-    prj.set("PWS_REFINEMENT", 8)
-
-    # Global settings
-    prj.set("N_CPU", 32)
-    prj.set("FSP_MAX_TIME_STEPS_PER_CYCLE", 700)
-    prj.set("FSP_GUI_FENSAP_MAX_TIME_STEPS_PER_CYCLE", 700)
+    prj.set_bulk(
+        {
+            # Case definition
+            "CASE_ROUGHNESS": 0.0004,
+            "CASE_CHARACTERISTIC_LENGTH": 0.431,
+            "CASE_VELOCITY": 50,
+            "CASE_ALTITUDE": 0,
+            "CASE_TEMPERATURE": 263.15,
+            "CASE_AOA": 0,
+            "CASE_MVD": 20,
+            "CASE_LWC": 0.0052,
+            "CASE_YPLUS": 0.3,
+            "PWS_REFINEMENT": 8,
+            # Global settings
+            "N_CPU": 32,
+            "FSP_MAX_TIME_STEPS_PER_CYCLE": 700,
+            "FSP_GUI_FENSAP_MAX_TIME_STEPS_PER_CYCLE": 700,
+        }
+    )
 
     # Job definitions
-    prj.add_job("XFOIL_REFINE")
-    prj.add_job("XFOIL_THICKEN_TE")
-    prj.add_job("XFOIL_PW_CONVERT")
-    prj.add_job("POINTWISE_GCI")
-    prj.add_job("FLUENT2FENSAP")
-    prj.add_job("FENSAP_RUN")
-    prj.add_job("FENSAP_CONVERGENCE_STATS")
-    prj.add_job("POSTPROCESS_SINGLE_FENSAP")
+    prj.add_jobs(
+        [
+            "XFOIL_REFINE",
+            "XFOIL_THICKEN_TE",
+            "XFOIL_PW_CONVERT",
+            "POINTWISE_GCI",
+            "FLUENT2FENSAP",
+            "FENSAP_RUN",
+            "FENSAP_CONVERGENCE_STATS",
+            "POSTPROCESS_SINGLE_FENSAP",
+        ]
+    )
 
     # Explicitly define the timing of each shot (20 shots, 30 s each). The
     # total time is derived from the sum of CASE_MULTISHOT.
     shot_times = [30] * 20
     prj.set("CASE_MULTISHOT", shot_times)
-    prj.add_job("MULTISHOT_RUN")
-    prj.add_job("POSTPROCESS_MULTISHOT")
-    prj.add_job("ANALYZE_MULTISHOT")
+    prj.add_jobs(["MULTISHOT_RUN", "POSTPROCESS_MULTISHOT", "ANALYZE_MULTISHOT"])
 
 
 if __name__ == "__main__":
@@ -10,11 +10,12 @@ s_cont_m = 17.4 * NM_TO_M   # Continuous maximum, meters
 s_int_m  = 2.6 * NM_TO_M    # Intermittent maximum, meters
 
 # Speed range for curves (m/s)
-V = np.linspace(10, 70, 400)
+V = np.geomspace(10, 70, 61)  # denser where 1/V bends most
 
-# Exposure time (minutes)
-t_cont = (s_cont_m / V) / 60.0
-t_int  = (s_int_m  / V) / 60.0
+# Exposure time (minutes): one reciprocal, then a scalar multiply per extent
+inv_V_min = 1.0 / (60.0 * V)   # min per metre
+t_cont = s_cont_m * inv_V_min
+t_int  = s_int_m  * inv_V_min
 
 # Plot
 plt.figure(figsize=(8, 5))
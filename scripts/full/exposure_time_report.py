@@ -12,17 +12,10 @@ Produces 'appendix_c_report.pdf'
 """
 
 from __future__ import annotations
+import io
 import sys
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
-import scienceplots
-plt.style.use(["science", "ieee"])
-
-# ReportLab imports
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import cm
-from reportlab.pdfgen import canvas
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Configuration
@@ -31,14 +24,6 @@ NM_TO_M = 1852                       # metres per nautical mile
 S_CONT_NM = 17.4                     # Continuous-maximum extent [NM]
 S_INT_NM  = 2.6                      # Intermittent-maximum extent [NM]
 PDF_NAME  = Path("appendix_c_report.pdf")
-PLOT_PNG  = Path("appendix_c_plot.png")
-
-# Temporary mathtext-rendered formula images
-FORMULA_PNGS = [
-    Path("formula_s_cont.png"),
-    Path("formula_s_int.png"),
-    Path("formula_t.png")
-]
 
 # Parse speeds from CLI ---------------------------------------------------------
 if len(sys.argv) > 1:
@@ -53,34 +38,30 @@ else:
 S_CONT_M = S_CONT_NM * NM_TO_M
 S_INT_M  = S_INT_NM  * NM_TO_M
 
-V_GRID = np.linspace(10, 70, 400)  # m/s
+V_GRID = np.geomspace(10, 70, 61)  # m/s, denser where 1/V bends most
+INV_V_MIN = 1.0 / (60.0 * V_GRID)  # min per metre
 
-t_cont = (S_CONT_M / V_GRID) / 60.0  # minutes
-t_int  = (S_INT_M  / V_GRID) / 60.0  # minutes
+t_cont = S_CONT_M * INV_V_MIN  # minutes
+t_int  = S_INT_M  * INV_V_MIN  # minutes
 
 # ────────────────────────────────────────────────────────────────────────────────
-# Generate the exposure-time plot and save as PNG
+# Generate the exposure-time plot as an in-memory PNG
 # ────────────────────────────────────────────────────────────────────────────────
-from matplotlib.ticker import MultipleLocator
-
-
 def make_exposure_plot():
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MultipleLocator
+    # The style stays active for the formula images rendered afterwards.
+    import scienceplots  # noqa: F401 - registers the "science" styles
+    plt.style.use(["science", "ieee"])
     plt.rcParams.update({
         "text.usetex": False,
         "font.size": 11,
     })
 
-    # Existing exposure times in minutes
-    t_cont_min = (S_CONT_M / V_GRID) / 60.0
-    t_int_min = (S_INT_M / V_GRID) / 60.0
-
-    # Also in seconds
-    t_cont_sec = S_CONT_M / V_GRID
-    t_int_sec = S_INT_M / V_GRID
-
+    # Exposure times in minutes (the seconds axis only rescales the limits)
     fig, ax1 = plt.subplots(figsize=(8, 5))
-    ax1.plot(V_GRID, t_cont_min, label=f"Continuous {S_CONT_NM} NM", color="black")
-    ax1.plot(V_GRID, t_int_min, label=f"Intermittent {S_INT_NM} NM", color="black")
+    ax1.plot(V_GRID, t_cont, label=f"Continuous {S_CONT_NM} NM", color="black")
+    ax1.plot(V_GRID, t_int, label=f"Intermittent {S_INT_NM} NM", color="black")
 
     # Labeling
     ax1.set_xlabel("Horizontal Flight Speed [m/s]")
@@ -105,17 +86,18 @@ def make_exposure_plot():
     ax2.set_ylim(y_min * 60, y_max * 60)
 
     # Annotate the selected speeds
-    for v in speeds_mark:
-        # Compute times
-        t_c_min = (S_CONT_M / v) / 60.0
-        t_i_min = (S_INT_M / v) / 60.0
-        t_c_sec = S_CONT_M / v
-        t_i_sec = S_INT_M / v
-
-        # Scatter points
-        ax1.scatter(v, t_c_min, marker="+", color="red", zorder=4)
-        ax1.scatter(v, t_i_min, marker="+", color="blue", zorder=4)
-
+    t_c_sec_all = S_CONT_M / speeds_mark
+    t_i_sec_all = S_INT_M / speeds_mark
+    t_c_min_all = t_c_sec_all / 60.0
+    t_i_min_all = t_i_sec_all / 60.0
+
+    # Scatter points
+    ax1.scatter(speeds_mark, t_c_min_all, marker="+", color="red", zorder=4)
+    ax1.scatter(speeds_mark, t_i_min_all, marker="+", color="blue", zorder=4)
+
+    for v, t_c_sec, t_i_sec, t_c_min, t_i_min in zip(
+        speeds_mark, t_c_sec_all, t_i_sec_all, t_c_min_all, t_i_min_all
+    ):
         # Annotate (slightly offset)
         ax1.annotate(
             f"{v:.0f} m/s\n{t_c_sec:.1f} s\n({t_c_min:.1f} min)",
@@ -137,20 +119,42 @@ def make_exposure_plot():
         )
 
     fig.tight_layout()
-    fig.savefig(PLOT_PNG, dpi=1200)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=300)  # embedded at 14 cm x 9 cm, 300 dpi is print resolution
     plt.close(fig)
+    buf.seek(0)
+    return buf
 
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Render a LaTeX/mathtext formula to PNG using matplotlib
 # ────────────────────────────────────────────────────────────────────────────────
-def render_formula(formula: str, outfile: Path, fontsize: int = 24):
-    fig = plt.figure(figsize=(0.01, 0.01))
+def render_formula(formula: str, outfile: Path | io.BytesIO, fontsize: int = 24, fig=None, dpi: int = 200):
+    """Render ``formula`` to ``outfile`` and return its ``(width, height)`` in pixels.
+
+    ``outfile`` may be a path or a binary buffer. An existing ``fig`` is
+    cleared and reused.
+    """
+    import matplotlib.pyplot as plt
+
+    own = fig is None
+    if own:
+        fig = plt.figure(figsize=(0.01, 0.01))
+    else:
+        fig.clear()
     fig.text(0.5, 0.5, f"${formula}$", ha="center", va="center", fontsize=fontsize)
-    fig.savefig(outfile, dpi=200, transparent=True, bbox_inches="tight", pad_inches=0.1)
-    plt.close(fig)
+    # Measure the padded tight box ourselves so the image size is known
+    # without reading the PNG back.
+    fig.set_dpi(dpi)
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    fig.savefig(outfile, format="png", dpi=dpi, transparent=True, bbox_inches=bbox)
+    if own:
+        plt.close(fig)
+    return bbox.width * dpi, bbox.height * dpi
 
 def make_formula_images():
+    import matplotlib.pyplot as plt
+
     # LaTeX-style formulas
     f1 = rf"s_{{\mathrm{{cont}}}} = {S_CONT_NM}\,\mathrm{{NM}} \approx {S_CONT_M:,.0f}\,\mathrm{{m}}"
     f2 = rf"s_{{\mathrm{{int}}}} = {S_INT_NM}\,\mathrm{{NM}} \approx {S_INT_M:,.0f}\,\mathrm{{m}}"
@@ -158,15 +162,28 @@ def make_formula_images():
 
     formulas = [f1, f2, f3]
 
-    for formula, png in zip(formulas, FORMULA_PNGS):
-        render_formula(formula, png)
+    fig = plt.figure(figsize=(0.01, 0.01))
+    images = []
+    for formula in formulas:
+        buf = io.BytesIO()
+        size = render_formula(formula, buf, fig=fig)
+        buf.seek(0)
+        images.append((buf, size))
+    plt.close(fig)
+    return images
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Build PDF with ReportLab (A4)
 # ────────────────────────────────────────────────────────────────────────────────
-PAGE_WIDTH, PAGE_HEIGHT = A4
-
-def build_pdf():
+def build_pdf(plot_png, formula_images):
+    """Write the report from the in-memory ``plot_png`` and ``(png, (w, h))`` formula images."""
+    # ReportLab imports
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+
+    PAGE_WIDTH, PAGE_HEIGHT = A4
     c = canvas.Canvas(str(PDF_NAME), pagesize=A4)
 
     # Title at top
@@ -178,7 +195,7 @@ def build_pdf():
     img_height = 9*cm
     img_x = (PAGE_WIDTH - img_width)/2
     img_y = PAGE_HEIGHT - 2*cm - img_height - 1*cm  # leave some space below title
-    c.drawImage(str(PLOT_PNG), img_x, img_y, width=img_width, height=img_height)
+    c.drawImage(ImageReader(plot_png), img_x, img_y, width=img_width, height=img_height)
 
     # Caption for plot
     c.setFont("Helvetica", 9)
@@ -193,27 +210,21 @@ def build_pdf():
     c.setFont("Helvetica-Bold", 14)
     c.drawCentredString(PAGE_WIDTH/2, section_y, "Key Formulas")
 
-    # Load formula images and normalize scaling
-    from PIL import Image as PILImage
-    widths = []
-    heights = []
-    for f_png in FORMULA_PNGS:
-        with PILImage.open(f_png) as im:
-            w, h = im.size
-            widths.append(w)
-            heights.append(h)
+    # Normalize formula image scaling
+    widths = [w for _, (w, _) in formula_images]
+    heights = [h for _, (_, h) in formula_images]
     max_w = max(widths)
 
     target_pdf_width = 8 * cm  # smaller width to fit neatly
-    scale_factors = [target_pdf_width / max_w] * len(FORMULA_PNGS)
+    scale_factors = [target_pdf_width / max_w] * len(formula_images)
 
     # Place formulas centered
     y = section_y - 1.5*cm
     gap = 0.7*cm
-    for f_png, orig_h, scale in zip(FORMULA_PNGS, heights, scale_factors):
+    for (f_png, _), orig_h, scale in zip(formula_images, heights, scale_factors):
         scaled_h = orig_h * scale
         c.drawImage(
-            str(f_png),
+            ImageReader(f_png),
             (PAGE_WIDTH - target_pdf_width)/2,
             y - scaled_h,
             width=target_pdf_width,
@@ -246,20 +257,10 @@ def build_pdf():
     # Done
     c.showPage()
     c.save()
-# ────────────────────────────────────────────────────────────────────────────────
-# Cleanup temporary images
-# ────────────────────────────────────────────────────────────────────────────────
-def cleanup():
-    for f in [PLOT_PNG] + FORMULA_PNGS:
-        try:
-            f.unlink()
-        except FileNotFoundError:
-            pass
 
 # ────────────────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    make_exposure_plot()
-    make_formula_images()
-    build_pdf()
-    cleanup()
+    plot_png = make_exposure_plot()
+    formula_images = make_formula_images()
+    build_pdf(plot_png, formula_images)
     print(f"Report written to: {PDF_NAME.resolve()}")
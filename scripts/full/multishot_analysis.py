@@ -28,82 +28,126 @@ Key options (unchanged)
 * `--var-index`    plot only the given variable (integer).
 * `--save-dir`     target folder for PNGs (auto‑created).
 * `--dpi`          image resolution (default 300).
+* `--jobs`         processes used to render the PNGs (default 1).
+* `--cache DIR`    keep the parsed STL/*.dat* data as `.npz` in *DIR* (off by default).
 
 Dependencies
 ~~~~~~~~~~~~
-    numpy ≥ 2.0, scipy, matplotlib, trimesh, scikit‑learn
+    numpy ≥ 2.0, scipy, matplotlib, trimesh
 Install with
-`pip install numpy scipy matplotlib trimesh scikit-learn`.
+`pip install numpy scipy matplotlib trimesh`.
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import hashlib
+import io
+from itertools import repeat
+import mmap
 import re
 import sys
 from pathlib import Path
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # PNGs only, no GUI backend needed
 import matplotlib.pyplot as plt
 import trimesh
 from scipy.spatial import cKDTree
-from sklearn.decomposition import PCA
 
 # --------------------------------------------------------------------------- #
 # Tecplot *.dat* utilities
 # --------------------------------------------------------------------------- #
-TEC_VARIABLE_RE = re.compile(r'VARIABLES\s*=\s*(.*)', re.IGNORECASE)
-TEC_ZONE_RE = re.compile(r'ZONE[^\n]*N\s*=\s*(\d+)[^\n]*', re.IGNORECASE)
-FORTRAN_BARE_EXP_RE = re.compile(r'^([+-]?\d*\.?\d*)([+-]\d+)$')
+TEC_VARIABLE_RE = re.compile(rb'VARIABLES\s*=\s*(.*)', re.IGNORECASE)
+TEC_ZONE_RE = re.compile(rb'ZONE[^\n]*N\s*=\s*(\d+)[^\n]*', re.IGNORECASE)
+CHUNK_LINES = 1_000_000  # node lines parsed per loadtxt call
+_RE_FORTRAN_D = re.compile(rb'(?<=[\d.])[dD](?=[+\-]?\d)')
+_RE_FORTRAN_EXP = re.compile(rb'(?<=\d)([+\-]\d{2,})')
 
 
 def _split_quoted_list(s: str):
-    parts, current, in_quotes = [], [], False
-    for ch in s:
-        if ch == '"':
-            in_quotes = not in_quotes
-            continue
-        if ch == ',' and not in_quotes:
-            parts.append(''.join(current).strip())
-            current = []
-        else:
-            current.append(ch)
-    if current:
-        parts.append(''.join(current).strip())
-    return parts
-
-
-def _to_float(tok: str) -> float:
-    tok = tok.strip().replace('D', 'E').replace('d', 'E')
-    if 'E' in tok or 'e' in tok:
-        return float(tok)
-    m = FORTRAN_BARE_EXP_RE.match(tok)
-    if m:
-        mant, exp = m.groups()
-        return float(f"{mant}E{exp}")
-    return float(tok)
+    return [p.strip() for p in next(csv.reader([s], skipinitialspace=True))]
+
+
+def _fix_fortran_exponents(block: bytes) -> bytes:
+    """Rewrite Fortran exponents (``1.0D+00``, ``1.23-105``) with ``e``."""
+    block = _RE_FORTRAN_D.sub(b'e', block)
+    return _RE_FORTRAN_EXP.sub(rb'e\1', block)  # fix 1-03 -> 1e-03
+
+
+def _skip_lines(buf, start: int, n: int) -> int:
+    """Return the offset just past the first *n* lines of *buf* after *start*."""
+    end = start
+    for _ in range(n):
+        end = buf.find(b'\n', end) + 1
+        if end == 0:
+            return len(buf)
+    return end
+
+
+def _find_zone(buf):
+    """Search the ZONE header in the first 4 KiB, then 64 KiB, then all of *buf*."""
+    for limit in (4096, 65536):
+        end = buf.rfind(b'\n', 0, limit) + 1  # whole lines only
+        m = TEC_ZONE_RE.search(buf, 0, end)
+        if m:
+            return m
+    return TEC_ZONE_RE.search(buf)
 
 
 def read_first_zone_dat(path: Path):
-    coords, variables = [], []
     var_names = None
-    text = path.read_text(encoding='utf‑8', errors='ignore')
-    m = TEC_VARIABLE_RE.search(text)
-    if m:
-        var_names = _split_quoted_list(m.group(1))
-    zone_m = TEC_ZONE_RE.search(text)
-    if not zone_m:
-        raise ValueError('No ZONE header found.')
-    n_nodes = int(zone_m.group(1))
-    lines = text[zone_m.end():].lstrip().splitlines()[:n_nodes]
-    for ln in lines:
-        nums = [_to_float(t) for t in re.split(r'[\s,]+', ln.strip()) if t]
-        coords.append(nums[:3])
-        variables.append(nums[3:])
-    return np.array(coords), np.array(variables), var_names
+    with path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        zone_m = _find_zone(mm)
+        if not zone_m:
+            raise ValueError('No ZONE header found.')
+        # VARIABLES belongs to the file header, i.e. precedes the first zone
+        m = TEC_VARIABLE_RE.search(mm, 0, zone_m.start())
+        if m:
+            var_names = _split_quoted_list(m.group(1).decode('utf-8', errors='ignore'))
+        n_nodes = int(zone_m.group(1))
+        pos = zone_m.end()
+        while pos < len(mm) and mm[pos:pos + 1].isspace():
+            pos += 1
+
+        # parse chunk-wise into one preallocated array so that only a slice
+        # of the text is ever held in memory next to the result
+        data, row = None, 0
+        while row < n_nodes and pos < len(mm):
+            end = _skip_lines(mm, pos, min(CHUNK_LINES, n_nodes - row))
+            block = _fix_fortran_exponents(mm[pos:end]).replace(b',', b' ')
+            chunk = np.loadtxt(io.BytesIO(block), comments=None, ndmin=2)
+            if data is None:
+                data = np.empty((n_nodes, chunk.shape[1]))
+            data[row:row + len(chunk)] = chunk
+            row += len(chunk)
+            pos = end
+    if data is None:
+        data = np.empty((0, 3))
+    data = data[:row]
+    return data[:, :3], data[:, 3:], var_names
 
 # --------------------------------------------------------------------------- #
 # STL path utilities
 # --------------------------------------------------------------------------- #
 
+def _unique_rows(verts: np.ndarray):
+    """``np.unique(verts, axis=0, return_inverse=True)`` without row-wise compares.
+
+    Each row is deduplicated as one 24-byte key; the unique rows are then put
+    back into lexicographic order so results match ``np.unique``.
+    """
+    c = np.ascontiguousarray(verts, dtype=float) + 0.0  # -0.0 → 0.0
+    keys = c.view(np.dtype((np.void, c.itemsize * c.shape[1]))).ravel()
+    _, idx, inv = np.unique(keys, return_index=True, return_inverse=True)
+    uniq = c[idx]
+    order = np.lexsort(uniq.T[::-1])
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return uniq[order], rank[inv]
+
+
 def make_path_from_vertices(verts: np.ndarray, axis: str = 'pca', reverse: bool = False):
     """Return cumulative arc‑length *s* for each vertex.
 
@@ -114,10 +158,15 @@ def make_path_from_vertices(verts: np.ndarray, axis: str = 'pca', reverse: bool
     reverse : bool
         If *True*, start at the opposite end.
     """
-    verts_u, inv = np.unique(verts, axis=0, return_inverse=True)
+    verts_u, inv = _unique_rows(verts)
 
     if axis == 'pca':
-        t = PCA(1).fit_transform(verts_u).ravel()
+        # first principal component; sign fixed like scikit-learn's PCA
+        # (largest loading positive) so --reverse keeps its meaning
+        c = verts_u - verts_u.mean(axis=0)
+        _, _, vt = np.linalg.svd(c, full_matrices=False)
+        pc = vt[0] * np.sign(vt[0][np.argmax(np.abs(vt[0]))])
+        t = c @ pc
     else:
         idx = {'x': 0, 'y': 1, 'z': 2}[axis]
         t = verts_u[:, idx]
@@ -127,19 +176,78 @@ def make_path_from_vertices(verts: np.ndarray, axis: str = 'pca', reverse: bool
         order = order[::-1]
 
     ordered = verts_u[order]
-    seg_lens = np.linalg.norm(np.diff(ordered, axis=0), axis=1)
-    s = np.concatenate([[0.0], np.cumsum(seg_lens)])
+    d = np.diff(ordered, axis=0)
+    seg_lens = np.einsum('ij,ij->i', d, d)
+    np.sqrt(seg_lens, out=seg_lens)
+    s = np.empty(len(ordered))
+    s[0] = 0.0
+    np.cumsum(seg_lens, out=s[1:])
     if np.ptp(ordered) > 10.0:  # assume mm → m
         s *= 1e-3
     return s, order, inv
 
 
 def load_stl_vertices(path: Path):
-    mesh = trimesh.load_mesh(str(path))
+    # raw vertices are enough: make_path_from_vertices deduplicates them
+    mesh = trimesh.load(str(path), process=False)
     if not isinstance(mesh, trimesh.Trimesh):
         raise ValueError('STL contains multiple solids.')
     return mesh.vertices
 
+# --------------------------------------------------------------------------- #
+# Preprocessing cache
+# --------------------------------------------------------------------------- #
+
+def _stamp(path: Path) -> str:
+    st = path.stat()
+    return f"{path.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _surface_data(stl: Path, dat: Path, axis: str, reverse: bool):
+    """Return ``(s_nodes, variables, names)`` for the first zone of *dat*."""
+    verts = load_stl_vertices(stl)
+    s_verts, order, inv = make_path_from_vertices(verts, axis, reverse)
+
+    # build the tree on the unique vertices only; STL repeats each one for
+    # every adjacent triangle
+    verts_u = np.empty((len(s_verts), verts.shape[1]))
+    verts_u[inv] = verts
+
+    coords, vars_, names = read_first_zone_dat(dat)
+    tree = cKDTree(verts_u, balanced_tree=False, compact_nodes=False)
+    _, nearest = tree.query(coords, workers=-1)
+    return s_verts[nearest], vars_, names
+
+
+def load_surface_data(stl: Path, dat: Path, axis: str = 'pca', reverse: bool = False,
+                      cache_dir: Path | None = None):
+    """Like :func:`_surface_data`, but reuse an ``.npz`` cache in *cache_dir*.
+
+    Entries are keyed by both input files (path, mtime, size) and the path
+    options, so edited inputs are processed again.
+    """
+    if cache_dir is None:
+        return _surface_data(stl, dat, axis, reverse)
+
+    key = hashlib.sha1(f"{_stamp(stl)}|{_stamp(dat)}|{axis}|{reverse}".encode()).hexdigest()
+    cached = cache_dir / f"{key}.npz"
+    try:
+        with np.load(cached) as z:
+            names = [str(n) for n in z['names']] if z['has_names'] else None
+            return z['s_nodes'], z['vars'], names
+    except (OSError, KeyError, ValueError):
+        pass
+
+    s_nodes, vars_, names = _surface_data(stl, dat, axis, reverse)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        np.savez(cached, s_nodes=s_nodes, vars=vars_, has_names=names is not None,
+                 names=np.array(names or [], dtype=str))
+    except OSError:
+        pass
+    return s_nodes, vars_, names
+
+
 # --------------------------------------------------------------------------- #
 # Plot util
 # --------------------------------------------------------------------------- #
@@ -147,6 +255,38 @@ def load_stl_vertices(path: Path):
 def _safe_name(name: str):
     return re.sub(r'[^0-9A-Za-z._-]+', '_', name)
 
+
+def _plot_curves(s_sorted, curves, dpi):
+    """Save each ``(y_sorted, label, fname)`` of *curves* with one reused figure.
+
+    Yields the file names as they are written.
+    """
+    fig, ax = plt.subplots(figsize=(8, 4))
+    # otherwise tight_layout starts from the previous variable's layout
+    margins = {k: getattr(fig.subplotpars, k) for k in ('left', 'right', 'bottom', 'top')}
+    line = None
+    try:
+        for y_sorted, label, fname in curves:
+            if line is None:
+                line, = ax.plot(s_sorted, y_sorted)
+                ax.set_xlabel('s  [m]')
+                ax.grid(True)
+            else:
+                line.set_ydata(y_sorted)
+                ax.relim()
+                ax.autoscale_view()
+            fig.subplots_adjust(**margins)
+            ax.set_ylabel(label)
+            fig.tight_layout()
+            fig.savefig(fname, dpi=dpi)
+            yield fname
+    finally:
+        plt.close(fig)
+
+
+def _plot_chunk(s_sorted, curves, dpi):
+    return list(_plot_curves(s_sorted, curves, dpi))
+
 # --------------------------------------------------------------------------- #
 # Main
 # --------------------------------------------------------------------------- #
@@ -165,12 +305,14 @@ def main(argv=None):
     p.add_argument('--save-dir', type=Path, default=Path('.'),
                    help='Directory to save PNGs (created if missing)')
     p.add_argument('--dpi', type=int, default=300)
+    p.add_argument('--jobs', type=int, default=1,
+                   help='Processes used to render the PNGs (default: 1)')
+    p.add_argument('--cache', type=Path, metavar='DIR',
+                   help='Reuse parsed STL/.dat data stored as .npz in DIR (default: off)')
     args = p.parse_args(argv)
 
-    verts = load_stl_vertices(args.stl)
-    s_verts, order, inv = make_path_from_vertices(verts, args.axis, args.reverse)
-
-    coords, vars_, names = read_first_zone_dat(args.dat)
+    s_nodes, vars_, names = load_surface_data(args.stl, args.dat, args.axis,
+                                              args.reverse, args.cache)
     if vars_.size == 0:
         sys.exit('No variables beyond X,Y,Z found.')
 
@@ -178,29 +320,32 @@ def main(argv=None):
     if max(indices) >= vars_.shape[1]:
         sys.exit('var-index out of range.')
 
-    tree = cKDTree(verts)
-    _, nearest = tree.query(coords)
-    s_nodes = s_verts[inv[nearest]]
-
     args.save_dir.mkdir(parents=True, exist_ok=True)
 
+    seq = np.argsort(s_nodes)
+    s_sorted = s_nodes[seq]
+    plots = []
     for idx in indices:
-        y = vars_[:, idx]
-        seq = np.argsort(s_nodes)
-        s_sorted, y_sorted = s_nodes[seq], y[seq]
-
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.plot(s_sorted, y_sorted)
-        ax.set_xlabel('s  [m]')
         label = (names[3+idx] if names and len(names) > 3+idx else f'Var{idx}')
-        ax.set_ylabel(label)
-        ax.grid(True)
-        fig.tight_layout()
-
         fname = args.save_dir / f"{args.dat.stem}_{_safe_name(label)}.png"
-        fig.savefig(fname, dpi=args.dpi)
-        print(f'Saved {fname}')
-        plt.close(fig)
+        plots.append((idx, label, fname))
+
+    if args.jobs > 1:
+        # PNG rendering and compression are CPU bound; one figure per worker,
+        # which renders a contiguous share of the variables
+        curves = [(vars_[seq, idx], label, fname) for idx, label, fname in plots]
+        n = -(-len(curves) // args.jobs)
+        chunks = [curves[i:i + n] for i in range(0, len(curves), n)]
+        with ProcessPoolExecutor(args.jobs) as ex:
+            for saved in ex.map(_plot_chunk, repeat(s_sorted), chunks, repeat(args.dpi)):
+                for fname in saved:
+                    print(f'Saved {fname}')
+    else:
+        y_sorted = np.empty_like(s_sorted)
+        curves = ((np.take(vars_[:, idx], seq, out=y_sorted), label, fname)
+                  for idx, label, fname in plots)
+        for fname in _plot_curves(s_sorted, curves, args.dpi):
+            print(f'Saved {fname}')
 
     if not args.all:
         print('Finished single‑variable plot.')
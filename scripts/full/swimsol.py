@@ -4,6 +4,9 @@
 plot_vs_y_lines.py – Lineplots jeder Variable vs. Y aus Tecplot ASCII-Dateien
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import io
+import os
 import sys
 import re
 import glob
@@ -11,37 +14,45 @@ from pathlib import Path
 import scienceplots
 
 import matplotlib
+matplotlib.use("Agg")  # nur PNG-Ausgabe, kein GUI-Backend nötig
 matplotlib.rcParams["text.usetex"] = False  # Deaktiviere LaTeX vollständig
 import matplotlib.pyplot as plt
 import pandas as pd
 plt.style.use(["science","ieee"])
 
-def fix_exponent(token: str) -> str:
-    token = token.replace("D", "E").replace("d", "E")
-    if re.fullmatch(r"[+-]?\d*\.?\d+[+-]\d+", token):
-        token = re.sub(r"([+-]?\d*\.?\d+)([+-]\d+)", r"\1E\2", token)
-    return token
+_TEXT_LINE = re.compile(r"^\s*[A-Za-z]", re.MULTILINE)
+_ZONE_N = re.compile(r"\bN\s*=\s*(\d+)", re.IGNORECASE)
+_RE_FORTRAN_D = re.compile(r"(?<=[\d.])[dD](?=[+\-]?\d)")
+_RE_FORTRAN_EXP = re.compile(r"(?<=\d)([+\-]\d{2,})")
+
+
+def fix_exponents(text: str) -> str:
+    """Schreibt Fortran-Exponenten (1.0D+00, 1.0-100) eines Textblocks als 'e'."""
+    text = _RE_FORTRAN_D.sub("e", text)
+    return _RE_FORTRAN_EXP.sub(r"e\1", text)  # 1-03 -> 1e-03
 
 
 def read_first_zone(path: Path) -> pd.DataFrame:
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    var_line = next(l for l in lines if l.strip().upper().startswith("VARIABLES"))
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    var_line = re.search(r"^\s*VARIABLES.*$", text, re.MULTILINE | re.IGNORECASE).group(0)
     var_names = [v.strip() for v in re.findall(r'"([^"]+)"', var_line)]
 
-    data_start = next(i for i, l in enumerate(lines) if l.strip().upper().startswith("ZONE")) + 1
-    rows = []
-    for l in lines[data_start:]:
-        if re.match(r"\s*[A-Za-z]", l):
-            break
-        if not l.strip():
-            continue
-        toks = [fix_exponent(t) for t in l.split()]
-        try:
-            rows.append([float(t) for t in toks])
-        except ValueError:
-            continue
-
-    df = pd.DataFrame(rows, columns=var_names[:len(rows[0])])
+    # Datenblock: ab der Zeile nach ZONE bis zur nächsten Textzeile
+    zone = re.search(r"^\s*ZONE.*$", text, re.MULTILINE | re.IGNORECASE)
+    end = _TEXT_LINE.search(text, zone.end())
+    block = text[zone.end():end.start() if end else len(text)]
+    n_nodes = _ZONE_N.search(zone.group(0))
+    if n_nodes:
+        # nur die N Knotenzeilen; die Konnektivität (FE-Zonen) folgt danach
+        lines = [ln for ln in block.splitlines() if ln.strip()]
+        block = "\n".join(lines[:int(n_nodes.group(1))])
+
+    df = pd.read_csv(io.StringIO(fix_exponents(block)), sep=r"\s+", header=None,
+                     engine="c", float_precision="round_trip")
+    if (df.dtypes == object).any():
+        df = df.apply(pd.to_numeric, errors="coerce")
+    df = df.astype(float)
+    df.columns = var_names[:df.shape[1]]
     df.columns = df.columns.str.strip()  # Leerzeichen aus Spaltennamen
     return df
 
@@ -57,27 +68,45 @@ def safe_label(text: str) -> str:
     )
 
 
+def _plot_lines(y, curves) -> None:
+    """Speichert jede Kurve ``(values, col, fname)`` mit einer wiederverwendeten Figure."""
+    fig, ax = plt.subplots(figsize=(8, 5))
+    # tight_layout startet sonst vom Layout der vorherigen Variable
+    margins = {k: getattr(fig.subplotpars, k) for k in ("left", "right", "bottom", "top")}
+    try:
+        for values, col, fname in curves:
+            ax.clear()
+            fig.subplots_adjust(**margins)
+            ax.plot(y, values, lw=1.2)
+            ax.set_xlabel("Y [m]")
+            ax.set_ylabel(safe_label(col))
+            ax.set_title(f"{safe_label(col)} vs Y")
+            ax.grid(True)
+            fig.tight_layout()
+            fig.savefig(fname, dpi=300)
+    finally:
+        plt.close(fig)
+
+
 def make_lineplots(df: pd.DataFrame, out_dir: Path, stem: str) -> None:
     # Sortiere nach Y, damit die Linien korrekt verlaufen
     sorted_df = df.sort_values("Y")
-    y = sorted_df["Y"]
+    y = sorted_df["Y"].to_numpy()
 
+    curves = []
     for col in sorted_df.columns:
         if col == "Y":
             continue
+        safe = re.sub(r"[^\w\-.]", "_", col.strip())
+        curves.append((sorted_df[col].to_numpy(), col, out_dir / f"{stem}_{safe}.png"))
 
-        fig = plt.figure(figsize=(8, 5))
-        plt.plot(y, sorted_df[col], lw=1.2)
-        plt.xlabel("Y [m]")
-        plt.ylabel(safe_label(col))
-        plt.title(f"{safe_label(col)} vs Y")
-        plt.grid(True)
-        plt.tight_layout()
+    _plot_lines(y, curves)
 
-        safe = re.sub(r"[^\w\-.]", "_", col.strip())
-        fig.savefig(out_dir / f"{stem}_{safe}.png", dpi=300)
-        plt.close(fig)
 
+def process_file(path: Path, out_dir: Path) -> str:
+    df = read_first_zone(path)
+    make_lineplots(df, out_dir, path.stem)
+    return f"✅ {path.name} → {len(df.columns)-1} Lineplots gespeichert in /plots/"
 
 
 def main():
@@ -88,12 +117,16 @@ def main():
     out_dir = Path("plots")
     out_dir.mkdir(exist_ok=True)
 
-    for pattern in sys.argv[1:]:
-        for file in sorted(glob.glob(pattern)):
-            path = Path(file)
-            df = read_first_zone(path)
-            make_lineplots(df, out_dir, path.stem)
-            print(f"✅ {path.name} → {len(df.columns)-1} Lineplots gespeichert in /plots/")
+    files = [Path(f) for pattern in sys.argv[1:] for f in sorted(glob.glob(pattern))]
+    workers = min(len(files), os.cpu_count() or 1)
+    if workers > 1:
+        # Dateien sind unabhängig: Einlesen und Plotten je Datei in eigenem Prozess
+        with ProcessPoolExecutor(workers) as ex:
+            for msg in ex.map(process_file, files, [out_dir] * len(files)):
+                print(msg)
+    else:
+        for path in files:
+            print(process_file(path, out_dir))
 
 
 if __name__ == "__main__":
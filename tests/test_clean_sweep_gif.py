@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -9,11 +10,11 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from scripts.clean_sweep_gif import collect_images, create_gif
 
 
-def _create_project(root: Path, uid: str, aoa: float) -> None:
+def _create_project(root: Path, uid: str, aoa: float, value: int = 0) -> None:
     proj = root / uid
     img_dir = proj / "analysis" / "FENSAP"
     img_dir.mkdir(parents=True)
-    img = Image.fromarray(np.zeros((1, 1, 3), dtype=np.uint8))
+    img = Image.fromarray(np.full((1, 1, 3), value, dtype=np.uint8))
     img.save(img_dir / "Pressure [N_m^2]_zoom.png")
     (proj / "case.yaml").write_text(f"CASE_AOA: {aoa}\n")
 
@@ -34,3 +35,69 @@ def test_gif_written(tmp_path):
     out = tmp_path / "09_clean_sweep_results" / "pressure_zoom.gif"
     create_gif(imgs, out)
     assert out.exists()
+
+
+def test_gifsicle_backend_falls_back(tmp_path, monkeypatch):
+    root = tmp_path / "08_clean_sweep"
+    _create_project(root, "p1", 0)
+    _create_project(root, "p2", 2, value=255)
+    monkeypatch.setattr("scripts.clean_sweep_gif.shutil.which", lambda _: None)
+    out = tmp_path / "09_clean_sweep_results" / "pressure_zoom.gif"
+    create_gif(collect_images(root), out, backend="gifsicle")
+    with Image.open(out) as gif:
+        assert gif.n_frames == 2
+
+
+def test_aoa_index_invalidated_on_change(tmp_path):
+    root = tmp_path / "08_clean_sweep"
+    _create_project(root, "p1", 3)
+    assert [a for a, _ in collect_images(root)] == [3.0]
+    assert not (root / ".aoa_index.json").exists()
+
+    assert [a for a, _ in collect_images(root, cache=True)] == [3.0]
+    assert (root / ".aoa_index.json").exists()
+
+    case = root / "p1" / "case.yaml"
+    case.write_text("CASE_AOA: 7\n")
+    os.utime(case, ns=(0, case.stat().st_mtime_ns + 10**9))
+    assert [a for a, _ in collect_images(root, cache=True)] == [7.0]
+
+
+def test_frame_cache_reused(tmp_path):
+    root = tmp_path / "08_clean_sweep"
+    _create_project(root, "p1", 0)
+    _create_project(root, "p2", 1, value=255)
+    imgs = collect_images(root)
+    out = tmp_path / "09_clean_sweep_results" / "pressure_zoom.gif"
+    create_gif(imgs, out)
+    assert not (out.parent / ".frame_cache").exists()
+
+    first = out.read_bytes()
+    create_gif(imgs, out, cache=True)
+    assert out.read_bytes() == first
+    cached = sorted((out.parent / ".frame_cache").iterdir())
+    assert len(cached) == 2
+
+    create_gif(imgs, out, cache=True)
+    assert out.read_bytes() == first
+    assert sorted((out.parent / ".frame_cache").iterdir()) == cached
+
+    create_gif(imgs[:1], out, cache=True)
+    assert len(list((out.parent / ".frame_cache").iterdir())) == 1
+
+
+def test_transparent_frames_match_with_cache(tmp_path):
+    root = tmp_path / "08_clean_sweep"
+    _create_project(root, "p1", 0)
+    img = root / "p1" / "analysis" / "FENSAP" / "Pressure [N_m^2]_zoom.png"
+    Image.fromarray(np.array([[[255, 0, 0, 255], [0, 0, 0, 0]]], dtype=np.uint8)).save(img)
+    imgs = collect_images(root)
+    out = tmp_path / "09_clean_sweep_results" / "pressure_zoom.gif"
+    create_gif(imgs, out)
+    first = out.read_bytes()
+    with Image.open(out) as gif:
+        assert gif.getpixel((1, 0)) == gif.info["transparency"]
+
+    create_gif(imgs, out, cache=True)
+    create_gif(imgs, out, cache=True)
+    assert out.read_bytes() == first
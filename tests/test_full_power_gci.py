@@ -125,6 +125,28 @@ def test_best_triplet_selected_from_cl(tmp_path, monkeypatch):
         assert actual == pytest.approx(expected)
 
 
+def test_richardson_triad_vectorised():
+    """Each element is evaluated as its own triad; degenerate ones become NaN."""
+    Q1 = [1.0, 1.0, 0.0]
+    Q2 = [0.95, 1.0, -0.1]
+    Q3 = [0.88, 0.9, -0.3]
+    p, q_ext, gci = full_power_gci.richardson_triad(Q3=Q3, Q2=Q2, Q1=Q1, r=2.0)
+
+    ratio = (0.88 - 0.95) / (0.95 - 1.0)
+    p0 = math.log(ratio) / math.log(2.0)
+    assert p[0] == pytest.approx(p0)
+    assert q_ext[0] == pytest.approx(1.0 + 0.05 / (2.0**p0 - 1.0))
+    assert gci[0] == pytest.approx(full_power_gci.FS * 0.05 / (2.0**p0 - 1.0))
+
+    # Q2 == Q1: no order can be observed
+    assert math.isnan(p[1]) and math.isnan(q_ext[1]) and math.isnan(gci[1])
+
+    # Q1 == 0: extrapolation works, relative GCI is undefined
+    assert p[2] == pytest.approx(1.0)
+    assert q_ext[2] == pytest.approx(0.1)
+    assert math.isnan(gci[2])
+
+
 def test_compute_h_from_merged(tmp_path):
     merged = tmp_path / "merged.dat"
     merged.write_text(
@@ -60,6 +60,21 @@ def test_project_add_job(tmp_path):
     assert cfg["RECIPE"] == "CUSTOM"
 
 
+def test_project_add_jobs(tmp_path, monkeypatch):
+    TemplateManager(Path(__file__).resolve().parents[1] / "glacium" / "templates")
+    project = Project(tmp_path).add_jobs(["POINTWISE_MESH2", "CONVERGENCE_STATS"]).create()
+    data = yaml.safe_load((tmp_path / project.uid / "_cfg" / "jobs.yaml").read_text())
+    assert "POINTWISE_MESH2" in data
+    assert "CONVERGENCE_STATS" in data
+
+    saves = []
+    monkeypatch.setattr(JobManager, "_save_status", lambda self: saves.append(1))
+    added = project.add_jobs(["FENSAP_RUN", "ICE3D_RUN"])
+    assert "FENSAP_RUN" in added
+    assert "ICE3D_RUN" in added
+    assert len(saves) == 1
+
+
 def test_load_add_job_and_run(tmp_path, monkeypatch):
     TemplateManager(Path(__file__).resolve().parents[1] / "glacium" / "templates")
     run = Project(tmp_path)
@@ -219,3 +234,24 @@ def test_project_update_unknown_key(tmp_path):
     project = Project(tmp_path).create()
     with pytest.raises(KeyError):
         project.set("UNKNOWN_KEY", 1)
+
+
+def test_project_set_bulk(tmp_path):
+    TemplateManager(Path(__file__).resolve().parents[1] / "glacium" / "templates")
+    project = Project(tmp_path).create()
+
+    project.set_bulk({"CASE_VELOCITY": 42.0, "FSP_MAX_TIME_STEPS_PER_CYCLE": 321})
+
+    case_file = tmp_path / project.uid / "case.yaml"
+    case = yaml.safe_load(case_file.read_text())
+    assert case["CASE_VELOCITY"] == 42.0
+
+    cfg_file = tmp_path / project.uid / "_cfg" / "global_config.yaml"
+    cfg = yaml.safe_load(cfg_file.read_text())
+    expected = generate_global_defaults(case_file, global_default_config())
+    assert cfg["FSP_MAX_TIME_STEPS_PER_CYCLE"] == 321
+    assert cfg["FSP_MACH_NUMBER"] == pytest.approx(expected["FSP_MACH_NUMBER"])
+
+    with pytest.raises(KeyError):
+        project.set_bulk({"CASE_VELOCITY": 1.0, "UNKNOWN_KEY": 1})
+    assert yaml.safe_load(case_file.read_text())["CASE_VELOCITY"] == 42.0
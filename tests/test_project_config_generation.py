@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -28,3 +29,19 @@ def test_project_config_generation(tmp_path):
     assert cfg["FSP_MACH_NUMBER"] == pytest.approx(expected["FSP_MACH_NUMBER"])
     assert cfg["PWS_AIRFOIL_FILE"] == expected["PWS_AIRFOIL_FILE"]
     assert cfg["PWS_REFINEMENT"] == expected["PWS_REFINEMENT"]
+
+
+def test_global_defaults_template_reloaded_on_change(tmp_path):
+    defaults = Path(global_default_config())
+    case_file = tmp_path / "case.yaml"
+    case_file.write_text(defaults.with_name("case.yaml").read_text())
+    template = tmp_path / "global_default.yaml"
+    template.write_text(defaults.read_text() + "\nEXTRA: [1]\n")
+
+    first = generate_global_defaults(case_file, template)
+    first["EXTRA"].append(2)
+    assert generate_global_defaults(case_file, template)["EXTRA"] == [1]
+
+    template.write_text(defaults.read_text() + "\nEXTRA: [3]\n")
+    os.utime(template, ns=(0, template.stat().st_mtime_ns + 10**9))
+    assert generate_global_defaults(case_file, template)["EXTRA"] == [3]